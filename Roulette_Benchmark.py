@@ -0,0 +1,268 @@
+"""Benchmarks of the rendering, physics, settlement and simulation hot paths.
+Headless benchmarks always run. The canvas benchmarks need a display; without one they are
+skipped, run them under a virtual display with xvfb-run. Results can be saved as a baseline
+and later runs compared against it, failing (exit code 1) when a benchmark got slower than
+the threshold allows.
+
+Examples:
+    python Roulette_Benchmark.py --save baseline.json
+    xvfb-run -a python Roulette_Benchmark.py --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+
+from Roulette_Rules import BET_IDS, BET_UNITS
+from Roulette_Engine import SpinEngine, resolve_winner
+
+BENCHMARKS = {}     # name -> (setup function, needs a display)
+
+def benchmark(name, display=False):
+    """Register a benchmark. The setup function gets the Tk root (None for headless ones) and
+    returns the function to time, or (prepare, function) when every call needs fresh state
+    that must not be timed."""
+    def register(setup):
+        BENCHMARKS[name] = (setup, display)
+        return setup
+    return register
+
+# Layout of n distinct bets, amounts valid for every bet type
+def bet_layout(n, seed=0):
+    rng = random.Random(seed)
+    return {bet_id: BET_UNITS[bet_id] * rng.randint(1, 20) for bet_id in rng.sample(BET_IDS, n)}
+
+def _spin_params(seed=0):
+    engine = SpinEngine(random.Random(seed))
+    params = engine.draw_params()
+    return engine, params, engine.settle(params)
+
+# ------------------------------ Headless ------------------------------
+
+@benchmark("resolve_winner")
+def _resolve_winner(root):
+    rng = random.Random(0)
+    wheel_angle, ball_angle = rng.random() * 6.28, rng.random() * 6.28
+    return lambda: resolve_winner(wheel_angle, ball_angle)
+
+@benchmark("spin_settle")
+def _spin_settle(root):
+    engine, params, _ = _spin_params()
+    return lambda: engine.settle(params)
+
+@benchmark("spin_physics_frames")
+def _spin_physics_frames(root):
+    # Every state the animation of one spin asks the engine for
+    engine, params, result = _spin_params()
+    def run():
+        for step in range(1, result.steps + 1):
+            engine.state_at(params, step)
+    return run
+
+def _payout_benchmark(n):
+    def setup(root):
+        from Roulette_Rules import compute_payout
+        bets = bet_layout(n)
+        return lambda: compute_payout(bets, 17)
+    return setup
+
+# The bet list has len(BET_IDS) distinct bets, so that is the largest layout
+for _n in (1, 50, len(BET_IDS)):
+    benchmark(f"compute_payout_{_n}")(_payout_benchmark(_n))
+
+@benchmark("simulate_100k")
+def _simulate(root):
+    from Roulette_Simulation import simulate
+    bets = bet_layout(50)
+    return lambda: simulate(100_000, bets, seed=1)
+
+@benchmark("odds_click_full_table")
+def _odds_click(root):
+    # One more chip on a table that already has a chip on every bet
+    from Roulette_Odds import LayoutOdds
+    odds = LayoutOdds()
+    odds.set_layout(bet_layout(len(BET_IDS)))
+    def click():
+        odds.add(("color", "RED"), 1)
+        odds.stats()
+    return click
+
+@benchmark("settle_10k_players_50_bets")
+def _settle_shared_table(root):
+    import numpy as np
+    from Roulette_Multiplayer import SharedTable, random_layouts
+    table = SharedTable(players=10_000, balance=10**9)
+    layouts = random_layouts(10_000, 50, np.random.default_rng(0))
+    return (lambda: table.place_bets(*layouts)), (lambda: table.settle(17))
+
+# ------------------------------ Canvas (needs a display) ------------------------------
+
+@benchmark("draw_static", display=True)
+def _draw_static(root):
+    from Roulette_GUI import WheelCanvas
+    wheel = WheelCanvas(root, radius=200)
+    def frame():
+        wheel.wheel_angle += 0.05
+        wheel.ball_angle -= 0.1
+        wheel.draw_static()
+        root.update_idletasks()
+    return frame
+
+@benchmark("draw_static_raster", display=True)
+def _draw_static_raster(root):
+    # The GUI's raster settings; the canvas renders its frames on creation, before timing
+    from Roulette_GUI import WheelCanvas
+    wheel = WheelCanvas(root, radius=200, raster=True)
+    def frame():
+        wheel.wheel_angle += 0.05
+        wheel.ball_angle -= 0.1
+        wheel.draw_static()
+        root.update_idletasks()
+    return frame
+
+def _spin_wheel_benchmark(raster):
+    # The work of one animated spin without the waits between frames, at the GUI's settings
+    def setup(root):
+        from Roulette_GUI import WheelCanvas
+        wheel = WheelCanvas(root, radius=200, raster=raster)
+        engine, params, result = _spin_params()
+        def run():
+            for step in range(1, result.steps + 1):
+                wheel.wheel_angle, wheel.ball_angle, _, _ = engine.state_at(params, step)
+                wheel.draw_static()
+            wheel.highlight_winner(wheel._resolve_winner())
+            root.update_idletasks()
+        return run
+    return setup
+
+benchmark("spin_wheel_frames", display=True)(_spin_wheel_benchmark(False))
+benchmark("spin_wheel_frames_raster", display=True)(_spin_wheel_benchmark(True))
+
+def _table(root):
+    from Roulette_GUI import TableCanvas
+    return TableCanvas(root, width=TableCanvas.CELL_W * 4, height=14 * TableCanvas.CELL_H + 40,
+                       chip_getter=lambda: 100)
+
+@benchmark("draw_table", display=True)
+def _draw_table(root):
+    table = _table(root)
+    def run():
+        table._draw_table()
+        root.update_idletasks()
+    return run
+
+@benchmark("clear_bets_50", display=True)
+def _clear_bets(root):
+    table = _table(root)
+    bets = bet_layout(50)
+    bets = {bet_id: amount for bet_id, amount in bets.items() if bet_id in table.cell_centers}
+    def run():
+        table.clear_bets()
+        root.update_idletasks()
+    return (lambda: table.place_bets(bets)), run
+
+# ------------------------------ Runner ------------------------------
+
+def measure(setup, root, rounds):
+    """Seconds per call: `rounds` samples, each averaged over enough calls to take ~0.2s."""
+    made = setup(root)
+    if isinstance(made, tuple):
+        prepare, fn = made
+        samples = []
+        for _ in range(rounds):
+            prepare()
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        return samples
+    timer = timeit.Timer(fn := made)
+    number, _ = timer.autorange()
+    return [t / number for t in timer.repeat(repeat=rounds, number=number)]
+
+def _display_root():
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as error:     # No tkinter or no display
+        print(f"Skipping canvas benchmarks: {error}")
+        return None
+    root.withdraw()
+    return root
+
+def run(names, rounds):
+    root = None
+    if any(BENCHMARKS[name][1] for name in names):
+        root = _display_root()
+    results = {}
+    for name in names:
+        setup, display = BENCHMARKS[name]
+        if display and root is None:
+            continue
+        samples = measure(setup, root, rounds)
+        results[name] = {"median": statistics.median(samples), "min": min(samples), "rounds": len(samples)}
+    if root is not None:
+        root.destroy()
+    return results
+
+# Benchmarks slower than baseline * (1 + threshold), as name -> ratio
+def regressions(results, baseline, threshold):
+    slower = {}
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if old and stats["median"] > old["median"] * (1 + threshold):
+            slower[name] = stats["median"] / old["median"]
+    return slower
+
+def _format_time(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:9.2f} us"
+    return f"{seconds * 1e3:9.3f} ms"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the roulette hot paths.")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--rounds", type=int, default=7, help="samples per benchmark")
+    parser.add_argument("--save", default=None, help="write the results as a baseline JSON file")
+    parser.add_argument("--compare", default=None, help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown vs the baseline median (0.25 = 25%%)")
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, display) in BENCHMARKS.items():
+            print(name + (" (display)" if display else ""))
+        return
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run(args.names or list(BENCHMARKS), args.rounds)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["benchmarks"]
+    for name, stats in results.items():
+        line = f"{name:<22}{_format_time(stats['median'])} median {_format_time(stats['min'])} min"
+        if name in baseline:
+            line += f"   {stats['median'] / baseline[name]['median'] - 1:+.1%} vs baseline"
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "benchmarks": results}, f, indent=2)
+    if args.compare:
+        slower = regressions(results, baseline, args.threshold)
+        if slower:
+            print("Regressions over {:.0%}: ".format(args.threshold)
+                  + ", ".join(f"{name} ({ratio:.2f}x)" for name, ratio in slower.items()))
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Calibration of the spin physics to a physical wheel.
+Takes a history of recorded outcomes (the winning number of every spin, optionally how long
+the spin took) and fits a WheelProfile that SpinEngine.from_profile and WheelCanvas load:
+
+    bias     one weight per number, the multinomial maximum likelihood over the 37 pockets
+             shrunk towards a fair wheel. The whole history reduces to a bincount, so the fit
+             costs the same for a thousand spins or ten million.
+    ranges   the deceleration ranges, fitted by maximum likelihood to the histogram of spin
+             lengths (in physics steps). Each candidate is scored on the same block of
+             simulated spins, so candidates differ only by their parameters.
+
+Only the ratio of speed to deceleration sets how long a spin lasts, so the speed ranges are
+kept and the deceleration ranges are scaled (`scale`) and widened or narrowed (`spread`)
+around their centers. Without timings the ranges are left as they are.
+
+History files are CSV (winner[,seconds] per line, # starts a comment) or Roulette_Journal
+files, whose recorded initial conditions give the spin lengths.
+
+Example:
+    python Roulette_Calibration.py history.csv --out wheel.json
+"""
+
+import argparse
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from Roulette_Engine import DEFAULT_RANGES, STEP_SECONDS, WheelProfile, save_profile
+from Roulette_Simulation import SpinBatch, settle_batch, stop_step_batch
+from Roulette_Stats import CHI2_CRITICAL
+
+POCKETS = 37
+
+class Calibration(NamedTuple):
+    """Fitted profile and how well it is supported by the history."""
+    profile: WheelProfile
+    g_statistic: float          # likelihood ratio statistic of the bias against a fair wheel
+    biased: bool                # g_statistic above the 95% critical value (36 degrees of freedom)
+    scale: float                # deceleration scale, 1.0 when no timings were given
+    spread: float               # deceleration spread, 1.0 when no timings were given
+    duration_log_likelihood: float
+    seconds: float
+
+# ------------------------------ History ------------------------------
+
+def read_history(path):
+    """Winning numbers and spin lengths in steps (None when the file has no timings)."""
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic == b"RLJ1":
+        from Roulette_Journal import Journal
+        records = Journal(path).records
+        winners = np.asarray(records["winner"], dtype=np.int64)
+        steps = np.maximum(stop_step_batch(records["wheel_vel"], records["wheel_decel"]),
+                           stop_step_batch(-records["ball_vel"], records["ball_decel"]))
+        return winners, steps.astype(np.int64)
+    data = np.loadtxt(path, delimiter=",", comments="#", ndmin=2)
+    winners = data[:, 0].astype(np.int64)
+    if len(winners) and (winners.min() < 0 or winners.max() >= POCKETS or (winners != data[:, 0]).any()):
+        raise ValueError(f"Winning numbers in {path} must be whole numbers from 0 to {POCKETS - 1}.")
+    steps = None
+    if data.shape[1] > 1:
+        steps = np.maximum(1, np.rint(data[:, 1] / STEP_SECONDS)).astype(np.int64)
+    return winners, steps
+
+def synthetic_history(spins, profile=WheelProfile(), seed=None):
+    """Winners and spin lengths of a simulated wheel with random starting angles, for testing
+    a calibration against a known profile."""
+    rng = np.random.default_rng(seed)
+    ranges = profile.ranges
+    accept = None if profile.bias is None else np.asarray(profile.bias) / max(profile.bias)
+    winners, steps = [], []
+    kept = 0
+    while kept < spins:
+        n = spins - kept
+        batch = SpinBatch(ranges.wheel_speed[0] + rng.random(n) * ranges.wheel_speed[1],
+                          -ranges.ball_speed[0] - rng.random(n) * ranges.ball_speed[1],
+                          ranges.wheel_decel[0] + rng.random(n) * ranges.wheel_decel[1],
+                          ranges.ball_decel[0] + rng.random(n) * ranges.ball_decel[1])
+        _, _, n_steps, n_winners = settle_batch(batch, rng.random(n) * 2 * np.pi, rng.random(n) * 2 * np.pi)
+        # Same rejection as SpinEngine.spin
+        keep = rng.random(n) < accept[n_winners] if accept is not None else np.ones(n, dtype=bool)
+        winners.append(n_winners[keep])
+        steps.append(n_steps[keep])
+        kept += int(keep.sum())
+    return np.concatenate(winners).astype(np.int64), np.concatenate(steps)
+
+# ------------------------------ Sector Bias ------------------------------
+
+def log_likelihood(counts, probabilities):
+    # Multinomial log likelihood of the pocket counts, pockets that never came contribute 0
+    counts = np.asarray(counts, dtype=np.float64)
+    return float(counts[counts > 0] @ np.log(np.asarray(probabilities)[counts > 0]))
+
+def fit_bias(counts, prior=1.0):
+    """Weights per number (mean 1) and the G statistic against a fair wheel. `prior` adds that
+    many pseudo-spins to every pocket, so short histories stay close to fair."""
+    counts = np.asarray(counts, dtype=np.float64)
+    total = counts.sum()
+    probabilities = (counts + prior) / (total + POCKETS * prior)
+    fair = np.full(POCKETS, 1 / POCKETS)
+    g = 2 * (log_likelihood(counts, counts / total) - log_likelihood(counts, fair)) if total else 0.0
+    return probabilities * POCKETS, g
+
+# ------------------------------ Decelerations ------------------------------
+
+def _scaled(decel, scale, spread):
+    # (low, span) scaled around the center of the range
+    center = decel[0] + decel[1] / 2
+    return (scale * (center - spread * decel[1] / 2), scale * spread * decel[1])
+
+def scaled_ranges(ranges, scale, spread):
+    return ranges._replace(wheel_decel=_scaled(ranges.wheel_decel, scale, spread),
+                           ball_decel=_scaled(ranges.ball_decel, scale, spread))
+
+class _DurationModel:
+    # Spin-length log likelihood of a candidate (scale, spread), on one block of uniforms
+    def __init__(self, steps, ranges, samples, seed):
+        self.ranges = ranges
+        self.bins = int(steps.max()) + 2            # last bin collects anything longer
+        self.observed = np.bincount(steps, minlength=self.bins).astype(np.float64)
+        self.samples = samples
+        u = np.random.default_rng(seed).random((samples, 4))
+        self.wheel_speed = ranges.wheel_speed[0] + u[:, 0] * ranges.wheel_speed[1]
+        self.ball_speed = ranges.ball_speed[0] + u[:, 1] * ranges.ball_speed[1]
+        self.u_wheel, self.u_ball = u[:, 2], u[:, 3]
+
+    def __call__(self, scale, spread):
+        (wheel_low, wheel_span), (ball_low, ball_span) = (_scaled(self.ranges.wheel_decel, scale, spread),
+                                                          _scaled(self.ranges.ball_decel, scale, spread))
+        if wheel_low <= 0 or ball_low <= 0:
+            return -np.inf
+        wheel_decel = wheel_low + self.u_wheel * wheel_span
+        ball_decel = ball_low + self.u_ball * ball_span
+        steps = np.maximum(stop_step_batch(self.wheel_speed, wheel_decel),
+                           stop_step_batch(self.ball_speed, ball_decel))
+        model = np.bincount(np.minimum(steps, self.bins - 1).astype(np.intp), minlength=self.bins)
+        # Half a pseudo-spin per bin, so a length the block never produced is unlikely, not impossible
+        pmf = (model + 0.5) / (self.samples + 0.5 * self.bins)
+        return float(self.observed @ np.log(pmf))
+
+def _best(model, scales, spreads):
+    scores = np.array([[model(s, k) for k in spreads] for s in scales])
+    i, j = np.unravel_index(np.argmax(scores), scores.shape)
+    return scales[i], spreads[j], scores[i, j]
+
+def fit_ranges(steps, ranges=DEFAULT_RANGES, samples=200_000, seed=0):
+    """Deceleration scale and spread that best explain the spin lengths: a coarse grid, then a
+    finer one around its best point. Returns (ranges, scale, spread, log likelihood)."""
+    model = _DurationModel(np.asarray(steps, dtype=np.int64), ranges, samples, seed)
+    scale, spread, _ = _best(model, np.geomspace(0.25, 4, 49), np.linspace(0.2, 4, 20))
+    scale, spread, score = _best(model, scale * np.geomspace(0.95, 1.05, 11),
+                                 np.clip(spread + np.linspace(-0.2, 0.2, 11), 0.01, None))
+    return scaled_ranges(ranges, scale, spread), float(scale), float(spread), score
+
+# ------------------------------ Calibration ------------------------------
+
+def calibrate(winners, steps=None, ranges=DEFAULT_RANGES, prior=1.0, keep_bias=False, samples=200_000, seed=0):
+    """Fit a WheelProfile to a history. The bias is only kept when it is significant at 95%,
+    or always with keep_bias."""
+    start = time.perf_counter()
+    winners = np.asarray(winners)
+    if not len(winners):
+        raise ValueError("The history has no spins to calibrate from.")
+    weights, g = fit_bias(np.bincount(winners, minlength=POCKETS), prior)
+    biased = g > CHI2_CRITICAL
+    scale = spread = 1.0
+    duration_ll = 0.0
+    if steps is not None:
+        ranges, scale, spread, duration_ll = fit_ranges(steps, ranges, samples, seed)
+    bias = tuple(float(w) for w in weights) if biased or keep_bias else None
+    return Calibration(WheelProfile(ranges, bias, len(winners)), g, biased, scale, spread,
+                       duration_ll, time.perf_counter() - start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit spin physics and sector bias to recorded outcomes.")
+    parser.add_argument("history", help="CSV of winner[,seconds] per spin, or a journal file")
+    parser.add_argument("--out", default="wheel.json", help="profile to write")
+    parser.add_argument("--prior", type=float, default=1.0, help="pseudo-spins per pocket for the bias")
+    parser.add_argument("--keep-bias", action="store_true", help="write the bias even when not significant")
+    parser.add_argument("--samples", type=int, default=200_000, help="simulated spins per candidate")
+    parser.add_argument("--synthetic", type=int, default=None, metavar="SPINS",
+                        help="first write a simulated history of this many spins to HISTORY")
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        winners, steps = synthetic_history(args.synthetic)
+        np.savetxt(args.history, np.column_stack([winners, steps * STEP_SECONDS]), fmt=["%d", "%.2f"],
+                   delimiter=",", header="winner,seconds")
+    start = time.perf_counter()
+    winners, steps = read_history(args.history)
+    read_seconds = time.perf_counter() - start
+    result = calibrate(winners, steps, prior=args.prior, keep_bias=args.keep_bias, samples=args.samples)
+    save_profile(result.profile, args.out, g_statistic=result.g_statistic, scale=result.scale, spread=result.spread)
+
+    ranges = result.profile.ranges
+    print(f"{len(winners):,} spins read in {read_seconds:.1f}s, fitted in {result.seconds:.1f}s")
+    print(f"Bias: G = {result.g_statistic:.1f} (95% critical value {CHI2_CRITICAL}), "
+          + ("biased" if result.biased else "no significant bias")
+          + ("" if result.profile.bias is None else ", weights "
+             + f"{min(result.profile.bias):.3f}..{max(result.profile.bias):.3f}"))
+    if steps is None:
+        print("No timings, deceleration ranges left at their defaults")
+    else:
+        print(f"Decelerations: scale {result.scale:.3f}, spread {result.spread:.2f} -> "
+              f"wheel {ranges.wheel_decel[0]:.4f}+{ranges.wheel_decel[1]:.4f}, "
+              f"ball {ranges.ball_decel[0]:.4f}+{ranges.ball_decel[1]:.4f}")
+    print(f"Profile written to {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""Headless spin engine for the roulette wheel.
+Computes where the wheel and ball stop without running the animation.
+This module must not import tkinter."""
+
+import json
+import math
+import random
+import time
+from typing import NamedTuple
+
+from Roulette_Rules import EUROPEAN_ORDER, SECTOR_ANGLE, check_bet, compute_payout
+
+TWO_PI = 2 * math.pi
+STEP = 0.03         # Angle advanced per step is velocity * STEP (was the "smoother animation" multiplier)
+STOP_VEL = 0.01     # Both velocities below this ends the spin
+STEP_SECONDS = 0.03 # Wall-clock length of one step when animated (the original 30 ms frame)
+
+# ------------------------------ Spin Physics ------------------------------
+
+class SpinParams(NamedTuple):
+    """Random initial conditions of one spin. The ball spins in the opposite direction (negative)."""
+    wheel_vel: float
+    ball_vel: float
+    wheel_decel: float
+    ball_decel: float
+
+class SpinRanges(NamedTuple):
+    """Uniform ranges the initial conditions are drawn from, each as (low, span).
+    Speeds are magnitudes, the ball velocity is negated when drawn."""
+    wheel_speed: tuple = (5, 2)
+    ball_speed: tuple = (10, 4)
+    wheel_decel: tuple = (0.04, 0.02)
+    ball_decel: tuple = (0.08, 0.03)
+
+DEFAULT_RANGES = SpinRanges()
+
+class WheelProfile(NamedTuple):
+    """Calibration of one physical wheel (written by Roulette_Calibration): the ranges its
+    spins are drawn from and a bias weight per number 0..36 (None for a fair wheel)."""
+    ranges: SpinRanges = DEFAULT_RANGES
+    bias: tuple = None
+    spins: int = 0          # recorded spins the profile was fitted on
+
+def load_profile(path):
+    with open(path) as f:
+        data = json.load(f)
+    ranges = SpinRanges(**{name: tuple(value) for name, value in data["ranges"].items()})
+    bias = tuple(data["bias"]) if data.get("bias") is not None else None
+    return WheelProfile(ranges, bias, data.get("spins", 0))
+
+def save_profile(profile, path, **extra):
+    # `extra` keys (fit statistics) are stored alongside and ignored by load_profile
+    data = {"ranges": {name: list(value) for name, value in profile.ranges._asdict().items()},
+            "bias": list(profile.bias) if profile.bias is not None else None,
+            "spins": profile.spins, **extra}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+class SpinResult(NamedTuple):
+    """Final state of a spin: stopping angles, number of physics steps and the winning number."""
+    params: SpinParams
+    wheel_angle: float
+    ball_angle: float
+    steps: int
+    winner: int
+
+def draw_params(rng, ranges=DEFAULT_RANGES):
+    # Same draw order as the original spin_wheel: 5 + random()*2, -10 - random()*4, ...
+    wheel_vel = ranges.wheel_speed[0] + rng.random() * ranges.wheel_speed[1]      # radians per frame
+    ball_vel = -ranges.ball_speed[0] - rng.random() * ranges.ball_speed[1]        # opposite direction, faster than the wheel
+    wheel_decel = ranges.wheel_decel[0] + rng.random() * ranges.wheel_decel[1]    # decel has to be pos.
+    ball_decel = ranges.ball_decel[0] + rng.random() * ranges.ball_decel[1]       # decel has to be pos.
+    return SpinParams(wheel_vel, ball_vel, wheel_decel, ball_decel)
+
+# Number of steps k >= 1 where speed - k*decel is still positive
+def moving_steps(speed, decel):
+    k = max(0, math.ceil(speed / decel) - 1)
+    # Guard against rounding in the division so the count agrees with speed - k*decel
+    while k > 0 and speed - k * decel <= 0:
+        k -= 1
+    while speed - (k + 1) * decel > 0:
+        k += 1
+    return k
+
+# First step k >= 1 where the speed has dropped below STOP_VEL
+def stop_step(speed, decel):
+    k = max(1, math.floor((speed - STOP_VEL) / decel) + 1)
+    # Same rounding guard as moving_steps
+    while k > 1 and speed - (k - 1) * decel < STOP_VEL:
+        k -= 1
+    while speed - k * decel >= STOP_VEL:
+        k += 1
+    return k
+
+# Distance covered after `steps` steps, the arithmetic series of the decelerating speed
+def travel(speed, decel, steps):
+    m = min(steps, moving_steps(speed, decel))
+    return STEP * (m * speed - decel * m * (m + 1) / 2)
+
+def spin_steps(params):
+    # The animation only ends when both the wheel and the ball are slow enough
+    return max(stop_step(params.wheel_vel, params.wheel_decel),
+               stop_step(-params.ball_vel, params.ball_decel))
+
+def resolve_winner(wheel_angle, ball_angle):
+    """
+    Determine winning number from relative angle of ball vs wheel.
+    Interpret the ball angle in the frame of the wheel.
+    """
+    # relative angle: where the ball is over the numbered ring after accounting for wheel rotation
+    rel_angle = (ball_angle - wheel_angle) % TWO_PI
+    # sector index
+    idx = round(rel_angle // SECTOR_ANGLE) % len(EUROPEAN_ORDER)
+    return EUROPEAN_ORDER[idx]
+
+class SpinEngine:
+    """Pure-Python spin engine. Draws the random initial conditions and settles a spin in O(1)
+    with the closed form of the step physics, so no animation is needed to get the outcome.
+    The GUI replays the same spin frame by frame with state_at()."""
+
+    def __init__(self, rng=None, ranges=DEFAULT_RANGES, bias=None, bias_rng=None):
+        # Any object with random() (random.Random, SystemRandom) or a Roulette_RNG source
+        self.rng = rng if rng is not None else random.Random()
+        self.ranges = ranges
+        # Sector bias: a spin landing on n is kept with probability bias[n] / max(bias), so the
+        # outcome still comes from the physics and only the odds between pockets are reweighted.
+        # The test draws from the same source, and a replay keeps the recorded spins as they are.
+        self.accept = None
+        if bias is not None:
+            if len(bias) != len(EUROPEAN_ORDER) or min(bias) <= 0:
+                raise ValueError(f"A wheel bias needs {len(EUROPEAN_ORDER)} positive weights, one per number.")
+            if not getattr(self.rng, "replays", False):
+                self.accept = [w / max(bias) for w in bias]
+        self.bias_rng = bias_rng if bias_rng is not None else self.rng
+        self.draws = 0          # initial conditions drawn so far
+        self.last_spin = None   # stream index of the last spin returned by spin()
+
+    @property
+    def seed(self):
+        # Seed of a seeded source (PhiloxSource), 0 when the stream cannot be regenerated
+        seed = getattr(self.rng, "seed", None)
+        return seed if isinstance(seed, int) else 0
+
+    @classmethod
+    def from_profile(cls, profile, rng=None):
+        """Engine for a calibrated wheel, `profile` is a WheelProfile or the path of its JSON file."""
+        if not isinstance(profile, WheelProfile):
+            profile = load_profile(profile)
+        return cls(rng, profile.ranges, profile.bias)
+
+    def draw_params(self):
+        spin_params = getattr(self.rng, "spin_params", None)    # Roulette_RNG sources hand out whole spins
+        if spin_params is not None:
+            params = spin_params(self.ranges)
+            self._last_draw = self.rng.spins - 1    # so PhiloxSource.seek(index) regenerates it
+        else:
+            params = draw_params(self.rng, self.ranges)
+            self._last_draw = self.draws
+        self.draws += 1
+        return params
+
+    # Angles and velocities after `step` physics steps, starting from the given angles
+    def state_at(self, params, step, wheel_angle=0.0, ball_angle=0.0):
+        wheel_speed, ball_speed = params.wheel_vel, -params.ball_vel
+        wheel_angle = (wheel_angle + travel(wheel_speed, params.wheel_decel, step)) % TWO_PI
+        ball_angle = (ball_angle - travel(ball_speed, params.ball_decel, step)) % TWO_PI
+        wheel_vel = max(0.0, wheel_speed - step * params.wheel_decel)
+        ball_vel = min(0.0, step * params.ball_decel - ball_speed)
+        return wheel_angle, ball_angle, wheel_vel, ball_vel
+
+    # Final state of a spin with the given initial conditions
+    def settle(self, params, wheel_angle=0.0, ball_angle=0.0):
+        steps = spin_steps(params)
+        wheel_angle, ball_angle, _, _ = self.state_at(params, steps, wheel_angle, ball_angle)
+        return SpinResult(params, wheel_angle, ball_angle, steps, resolve_winner(wheel_angle, ball_angle))
+
+    # Draw new initial conditions and settle them, redrawing the spins the wheel bias rejects
+    def spin(self, wheel_angle=0.0, ball_angle=0.0):
+        while True:
+            result = self.settle(self.draw_params(), wheel_angle, ball_angle)
+            if self.accept is None or self.bias_rng.random() < self.accept[result.winner]:
+                self.last_spin = self._last_draw
+                return result
+
+# ------------------------------ Animation Clock ------------------------------
+
+class SpinClock:
+    """Maps wall-clock time to physics steps, so an animated spin takes steps * step_seconds on
+    any machine. Each frame asks for the current step and renders only that state; when frames
+    are late the steps in between are skipped instead of slowing the spin down."""
+
+    def __init__(self, total_steps, step_seconds=STEP_SECONDS, clock=time.perf_counter):
+        self.total_steps = total_steps
+        self.step_seconds = step_seconds
+        self.clock = clock
+        self.start = clock()
+        self.last_step = 0
+        self.frames = 0         # frames that advanced the spin
+        self.skipped = 0        # steps that were never rendered
+
+    @property
+    def done(self):
+        return self.last_step >= self.total_steps
+
+    # Step the spin should show now, or None when it has not advanced since the last frame
+    def advance(self):
+        step = min(self.total_steps, int((self.clock() - self.start) / self.step_seconds))
+        if step <= self.last_step:
+            return None
+        self.skipped += step - self.last_step - 1
+        self.frames += 1
+        self.last_step = step
+        return step
+
+    # Turbo: the next advance() returns the final step
+    def finish(self):
+        self.start -= self.total_steps * self.step_seconds
+
+# ------------------------------ Game State ------------------------------
+
+class RouletteTable:
+    """Game state of one table without any widgets: the player's balance, the bets
+    (bet_id -> amount) and the spin flag. Used by the GUI and by the table server.
+    With a journal (Roulette_Journal.JournalWriter) every settled round is recorded."""
+
+    def __init__(self, balance=2000, engine=None, journal=None):
+        self.balance = balance
+        self.bets = {}
+        self.isSpinning = False
+        self.engine = engine if engine is not None else SpinEngine()
+        self.journal = journal
+        self.wheel_angle = 0.0      # Where the wheel and ball rest between spins
+        self.ball_angle = 0.0
+
+    def total_bet(self):
+        return sum(self.bets.values())
+
+    def place_bet(self, bet_id, amount):
+        if self.isSpinning:
+            raise ValueError("Bets are closed while the wheel is spinning.")
+        check_bet(bet_id, amount)
+        self.bets[bet_id] = self.bets.get(bet_id, 0) + amount
+
+    def clear_bets(self):
+        if self.isSpinning:
+            raise ValueError("Bets cannot be cleared while the wheel is spinning.")
+        self.bets.clear()
+
+    # Validate the bets and take the stake from the balance
+    def begin_spin(self):
+        total = self.total_bet()
+        if total == 0:
+            raise ValueError("Please place at least one bet before spinning.")
+        if total > self.balance:
+            raise ValueError("You do not have enough balance to cover your bets.")
+        self.balance -= total
+        self.isSpinning = True
+
+    # Pay the bets for the winning number, returns the payout
+    def settle(self, winner):
+        payout = compute_payout(self.bets, winner)
+        self.balance += payout
+        self.isSpinning = False
+        return payout
+
+    # Write a settled round to the journal, if there is one
+    def record(self, result, payout):
+        if self.journal is not None:
+            self.journal.append(result, self.bets, payout, self.engine.seed, self.engine.last_spin or 0)
+
+    # Run a whole round headlessly, returns the SpinResult and the payout
+    def play(self):
+        self.begin_spin()
+        result = self.engine.spin(self.wheel_angle, self.ball_angle)
+        self.wheel_angle, self.ball_angle = result.wheel_angle, result.ball_angle
+        payout = self.settle(result.winner)
+        self.record(result, payout)
+        return result, payout
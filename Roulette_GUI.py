@@ -0,0 +1,831 @@
+"""Yuhan Peter Bauer, Zephyr Bégin Zhang, and Hakeem Pit Al-Timime
+
+Tkinter front end of the game. Roulette_Project imports this module only when the window
+classes are first used, so headless code never loads Tk."""
+
+import tkinter as tk
+from tkinter import messagebox
+import math
+import os
+import time
+from collections import deque
+
+# ------------------------------ Configuration & Helpers ------------------------------
+
+# Rules and colours live in Roulette_Rules so headless tools can use them without tkinter
+from Roulette_Rules import (EUROPEAN_ORDER, SECTOR_ANGLE, check_bet,
+                            DARK_GREEN, GREEN, RED, BLACK, number_color, ROW1, ROW2, ROW3)
+from Roulette_Engine import SpinEngine, SpinClock, RouletteTable, WheelProfile, load_profile, resolve_winner
+from Roulette_Layout import CELL_W, CELL_H, TableLayout
+from Roulette_Profiler import Profiler, instrumented
+from Roulette_Stats import LiveStats, CHI2_CRITICAL
+from Roulette_Odds import LayoutOdds
+
+# Unit-circle table for the wheel at rotation 0: sector edges (one extra to close the last wedge)
+# and label directions. The renderer rotates these instead of calling cos/sin for every item.
+SECTOR_EDGES = [(math.cos(i * SECTOR_ANGLE), math.sin(i * SECTOR_ANGLE))
+                for i in range(len(EUROPEAN_ORDER) + 1)]
+SECTOR_MIDDLES = [(math.cos((i + 0.5) * SECTOR_ANGLE), math.sin((i + 0.5) * SECTOR_ANGLE))
+                  for i in range(len(EUROPEAN_ORDER))]
+
+#Font
+BASE_FONT = ("Comfortaa", 12, "bold")
+
+# ------------------------------ Wheel Canvas ------------------------------
+
+class WheelCanvas(tk.Canvas):
+    """Canvas subclass that draws the roulette wheel and animates the spin.
+    Handles angles, physics simulation, ball movement, and winner detection.
+    """
+    BALL_RADIUS = 6
+    FRAME_SAMPLES = 120     # Number of recent frames kept by the frame-time counter
+
+    def __init__(self, parent, radius=140, retained=True, engine=None, target_fps=33, turbo=False,
+                 raster=False, sprite_resolution=3.0, sprite_dir=None, profile=None, **kwargs):
+        # Create a wheel canvas to fit the wheel
+        super().__init__(parent, width=2*(radius+30), height=2*(radius+30), bg=DARK_GREEN, highlightthickness=0, **kwargs)
+
+        self.update_idletasks()
+        self.height = self.winfo_reqheight()
+        self.width = self.winfo_reqwidth()
+                
+        self.radius = radius
+        self.center = (self.winfo_reqwidth()//2, self.winfo_reqheight()//2)
+
+        #ADDED FOR HIGHLIGHT_WINNER METHOD
+        self.highlight_id = None
+
+        self.wheel_angle = 0.0              # rotation of wheel (radians)
+        self.ball_angle = 0.0               # current ball angle (radians)
+        self.wheel_vel = 0.0                # wheel angular velocity
+        self.ball_vel = 0.0                 # ball angular velocity
+        self.wheel_decel = 0.0              # wheel angular decel
+        self.ball_decel = 0.0               # ball angular decel
+        self.isAnimating = False
+        self.items = {}
+        # Settles spins, no tkinter needed. A wheel profile (Roulette_Calibration) sets its ranges and bias.
+        if engine is None:
+            engine = SpinEngine.from_profile(profile) if profile is not None else SpinEngine()
+        self.engine = engine
+        self.last_result = None
+        self.last_clock = None              # SpinClock of the last spin, counts rendered and skipped steps
+        self.target_fps = target_fps        # Frames per second the animation aims for
+        self.turbo = turbo                  # Skip the animation, show the final frame
+
+        # Retained mode builds the canvas items once and only moves them every frame.
+        # Immediate mode (retained=False) is the original delete-and-redraw renderer,
+        # kept so both can be timed with the frame-time counter.
+        self.retained = retained
+        self.frame_times = deque(maxlen=WheelCanvas.FRAME_SAMPLES)  # seconds per draw_static call
+        self.profiler = None    # Profiler, when attached the draw and physics timings are recorded
+
+        # Raster mode shows pre-rendered wheel faces (Roulette_Sprites, needs Pillow): every frame
+        # is one image swap and one ball move. Faces are `sprite_resolution` degrees apart and all
+        # of them are rendered up front, a spin sweeps through every one of them.
+        self.raster = raster
+        self.sprites = None
+        if raster:
+            from Roulette_Sprites import SpriteCache
+            from PIL import ImageTk
+            self.sprites = SpriteCache(radius, sprite_resolution, cache_dir=sprite_dir,
+                                       convert=lambda image: ImageTk.PhotoImage(image, master=self))
+            self.sprites.prerender()
+
+        self.draw_static()
+
+        # self.bind('<Button-1>', self.spin_wheel(self.highlight_winner))  # Left click to spin?
+        
+    # Draw the wheel. Everything is static, updates make it look dynamic
+    @instrumented("draw_static")
+    def draw_static(self):
+        start = time.perf_counter()
+        if self.raster:
+            self._draw_raster()
+        elif self.retained:
+            if not self.items:
+                self._build_items()
+            self._move_items()
+        else:
+            self._draw_immediate()
+        self.frame_times.append(time.perf_counter() - start)
+
+    # Average and worst draw time in milliseconds over the recent frames
+    def frame_time_stats(self):
+        if not self.frame_times:
+            return {"frames": 0, "avg_ms": 0.0, "max_ms": 0.0}
+        return {"frames": len(self.frame_times),
+                "avg_ms": 1000 * sum(self.frame_times) / len(self.frame_times),
+                "max_ms": 1000 * max(self.frame_times)}
+
+    # Create every wheel item once and keep its id. Positions are set by _move_items
+    def _build_items(self):
+        cx, cy = self.center
+        R = self.radius
+        # Outer ring of the table
+        self.items["ring"] = self.create_oval(cx-R-20, cy-R-20, cx+R+20, cy+R+20, fill="#3C1912", outline="")
+
+        # One wedge and one label per number, coordinates are filled in on the first move
+        self.items["sectors"] = [self.create_polygon(cx, cy, cx, cy, cx, cy, fill=number_color(n), outline="#111")
+                                 for n in EUROPEAN_ORDER]
+        self.items["labels"] = [self.create_text(cx, cy, text=str(n), fill="white", font=BASE_FONT)
+                                for n in EUROPEAN_ORDER]
+
+        # Inner circle to cover triangle tips
+        self.items["inner"] = self.create_oval(cx-R+45, cy-R+45, cx+R-45, cy+R-45, fill="#222", outline="#111")
+
+        # Ball is created last so it stays on top of the wheel
+        self.items["ball"] = self.create_oval(cx, cy, cx, cy, fill="white", outline="black", width=1)
+
+    # Rotate the existing items to the current wheel and ball angles
+    def _move_items(self):
+        # A leftover highlight belongs to the previous spin, the old renderer wiped it with delete("all")
+        if self.highlight_id is not None:
+            self.delete(self.highlight_id)
+            self.highlight_id = None
+
+        cx, cy = self.center
+        R = self.radius
+        r_text = R - 15
+        # Rotating the precomputed unit vectors by the wheel angle needs only one cos/sin pair per frame
+        cw, sw = math.cos(self.wheel_angle), math.sin(self.wheel_angle)
+        edges = [(cx + R * (c*cw - s*sw), cy + R * (s*cw + c*sw)) for c, s in SECTOR_EDGES]
+
+        for idx, sector in enumerate(self.items["sectors"]):
+            x1, y1 = edges[idx]
+            x2, y2 = edges[idx + 1]
+            self.coords(sector, cx, cy, x1, y1, x2, y2)
+
+        for label, (c, s) in zip(self.items["labels"], SECTOR_MIDDLES):
+            self.coords(label, cx + r_text * (c*cw - s*sw), cy + r_text * (s*cw + c*sw))
+
+        r_to_ball = R - 35
+        bx = cx + r_to_ball * math.cos(self.ball_angle)
+        by = cy + r_to_ball * math.sin(self.ball_angle)
+        br = WheelCanvas.BALL_RADIUS
+        self.coords(self.items["ball"], bx-br, by-br, bx+br, by+br)
+
+    # Raster mode: show the pre-rendered face nearest to the wheel angle and move the ball
+    def _draw_raster(self):
+        if self.highlight_id is not None:
+            self.delete(self.highlight_id)
+            self.highlight_id = None
+
+        cx, cy = self.center
+        face = self.sprites.frame(self.wheel_angle)
+        if not self.items:
+            self.items["face"] = self.create_image(cx, cy, image=face)
+            self.items["ball"] = self.create_oval(cx, cy, cx, cy, fill="white", outline="black", width=1)
+        else:
+            self.itemconfig(self.items["face"], image=face)
+
+        # The face is the nearest pre-rendered frame, the ball keeps its angle relative to
+        # the wheel so it sits in the same pocket as in the exact state
+        ball_angle = self.ball_angle - self.wheel_angle + self.shown_wheel_angle()
+        r_to_ball = self.radius - 35
+        bx = cx + r_to_ball * math.cos(ball_angle)
+        by = cy + r_to_ball * math.sin(ball_angle)
+        br = WheelCanvas.BALL_RADIUS
+        self.coords(self.items["ball"], bx-br, by-br, bx+br, by+br)
+
+    # Wheel angle as drawn: raster mode shows the face of the nearest sprite frame
+    def shown_wheel_angle(self):
+        if self.raster:
+            return self.sprites.angle(self.sprites.index(self.wheel_angle))
+        return self.wheel_angle
+
+    # Frame cost of this renderer, plus the memory of the sprite frames in raster mode
+    def render_stats(self):
+        mode = "raster" if self.raster else "retained" if self.retained else "immediate"
+        stats = {"mode": mode, **self.frame_time_stats()}
+        if self.sprites is not None:
+            stats.update(sprites=self.sprites.stats())
+        return stats
+
+    # Original renderer: delete everything and redraw the whole wheel every frame
+    def _draw_immediate(self):
+        self.delete("all")
+        self.highlight_id = None
+        self.items = {}
+        cx, cy = self.center
+        R = self.radius
+        # Outer ring of the table
+        self.create_oval(cx-R-20, cy-R-20, cx+R+20, cy+R+20, fill="#3C1912", outline="")
+         
+        # Number ring (sectors)
+        for indx, n in enumerate(EUROPEAN_ORDER):
+            a0 = indx * SECTOR_ANGLE + self.wheel_angle
+            a1 = a0 + SECTOR_ANGLE
+            # draw sector as a wedge polygon
+            p0 = (cx, cy)
+            r1 = R
+            x1, y1 = cx + r1 * math.cos(a0), cy + r1 * math.sin(a0)
+            x2, y2 = cx + r1 * math.cos(a1), cy + r1 * math.sin(a1)
+            
+            col = number_color(n)   # Set color based on number 
+            # Creates a triangle sector for each number
+            self.create_polygon(p0[0], p0[1], x1, y1, x2, y2, fill=col, outline="#111")
+
+        
+        # Number labels
+        for idx, n in enumerate(EUROPEAN_ORDER):
+            a = (idx + 0.5) * SECTOR_ANGLE + self.wheel_angle
+            r_text = R - 15 # Set text radius so it's placed inside visible part of triangle
+            x, y = cx + r_text * math.cos(a), cy + r_text * math.sin(a)
+            self.create_text(x, y, text=str(n), fill="white", font=BASE_FONT)
+        
+        # Inner circle to cover triangle tips
+        self.create_oval(cx-R+45, cy-R+45, cx+R-45, cy+R-45, fill="#222", outline="#111")
+
+        # Create ball and give id
+        # The ball is drawn on edge as to not overlap with numbers
+        # Otherwise it would be hard to see
+        r_to_ball = R - 35 # Ball distance from center of wheel
+        BALL_RADIUS = WheelCanvas.BALL_RADIUS
+        bx = cx + r_to_ball * math.cos(self.ball_angle)
+        by = cy + r_to_ball * math.sin(self.ball_angle)
+        self.items["ball"] = self.create_oval(bx-BALL_RADIUS, by-BALL_RADIUS, bx+BALL_RADIUS, by+BALL_RADIUS, fill="white", outline="black", width=1)
+
+    # Set initial angles of wheel and ball, used for testing
+    '''
+    def set_angles(self, wheel_angle, ball_angle):
+        self.wheel_angle = wheel_angle
+        self.ball_angle = ball_angle
+        self.draw_static()
+    '''
+    # on_done is the callback function when spin is done
+    # This function animates the wheel and ball spinning and decelerating
+    # The outcome is settled up front by the engine, the animation only replays it
+    def spin_wheel(self, on_done):
+        if self.isAnimating: return # prevent multiple spins at once
+        self.isAnimating = True
+        
+        # Randomize initial velocities and decelerations
+        # Have spin be in opposite directions
+        start_wheel, start_ball = self.wheel_angle, self.ball_angle
+        result = self.engine.spin(start_wheel, start_ball)     # Applies the wheel profile, if any
+        params = result.params
+        self.wheel_vel, self.ball_vel, self.wheel_decel, self.ball_decel = params
+        self.last_result = result   # Kept for the journal
+
+        # The clock decides which step to show, so the spin lasts as long on a slow machine.
+        # Turbo skips the animation and shows the final frame right away.
+        clock = SpinClock(result.steps)
+        self.last_clock = clock
+        if self.turbo:
+            clock.finish()
+        frame_ms = 1000 / self.target_fps
+
+        # Helper fuction to update the animation
+        def update():
+            if not self.isAnimating: return # Prevent updates if animation stopped
+            frame_start = time.perf_counter()
+
+            # Jump to the step for the elapsed time and take the angles from the engine's closed form
+            step = clock.advance()
+            if step is not None:
+                self.wheel_angle, self.ball_angle, self.wheel_vel, self.ball_vel = \
+                    self.engine.state_at(params, step, start_wheel, start_ball)
+                if self.profiler is not None:
+                    self.profiler.record("physics_step", frame_start, time.perf_counter())
+                self.draw_static()
+            
+            # Check if both have stopped to end animation
+            if clock.done:
+                self.isAnimating = False
+                
+                # determine winner
+                winner = self._resolve_winner()
+                self.highlight_winner(winner)
+                if self.profiler is not None:
+                    # Once per spin and outside the timed sections, counting items is a Tk round trip
+                    self.profiler.count("wheel_items", len(self.find_all()))
+                on_done(winner)
+            else:
+                # Next frame at the target rate, minus the time this frame took
+                spent_ms = 1000 * (time.perf_counter() - frame_start)
+                self.after(max(1, round(frame_ms - spent_ms)), update)
+                
+        update()
+    
+    @instrumented("resolve_winner")
+    def _resolve_winner(self):
+        """Determine winning number from relative angle of ball vs wheel."""
+        return resolve_winner(self.wheel_angle, self.ball_angle)
+
+    def highlight_winner(self, num):
+        if self.highlight_id is not None:
+            self.delete(self.highlight_id)
+            self.highlight_id = None
+
+        cx, cy = self.center
+        R = self.radius
+        idx = EUROPEAN_ORDER.index(num)
+        a0 = idx * SECTOR_ANGLE + self.shown_wheel_angle()
+        a1 = a0 + SECTOR_ANGLE
+        x1, y1 = cx + R * math.cos(a0), cy + R * math.sin(a0)
+        x2, y2 = cx + R * math.cos(a1), cy + R * math.sin(a1)
+        self.highlight_id = self.create_polygon(
+            cx, cy, x1, y1, x2, y2,
+            fill="", outline="yellow", width=3
+    )
+    #HIGHLIGHT_ID ADDED B/C PREVENT MULTIPLE OVERLAPPNG HIGHLIGHTS 
+
+
+# ------------------------------ Betting Table Canvas ------------------------------
+
+class TableCanvas(tk.Canvas):
+    """Canvas for displaying the roulette betting table.
+    Draws the betting layout and handles bet placements.
+    Vertical placement"""
+    
+    
+    CELL_W, CELL_H = CELL_W, CELL_H   # cell size
+    
+        # Real casino horizontal layout (3 rows, 12 columns)
+    ROW1, ROW2, ROW3 = ROW1, ROW2, ROW3
+    
+    def __init__(self, parent, width, height, chip_getter, bets=None, on_change=None, probabilities=None, **kwargs):
+        super().__init__(parent, width=width+20, height=height, bg=DARK_GREEN, highlightthickness=0, **kwargs)
+        self.chip_getter = chip_getter  # Function to get current chip value
+        self.on_change = on_change      # Called after the bets changed, e.g. to show the odds
+        self.odds = LayoutOdds(probabilities)   # Odds of the bets on the table, updated bet by bet
+        self.cell_map = {}  # Map of cell coordinates to bet types.     cell_id -> bet_id   bet_id is split in bet type and it's value
+        self.bets = bets if bets is not None else {}  # Dictionary to store bets placed.   bet_id -> amount
+        self.drawn_chips = {}  # Map of cell_id to chip item on canvas  bet_id -> chip, text
+        self.bet_cells = {}  # Reverse of cell_map.                     bet_id -> cell_id
+        self.cell_centers = {}  # Chip position of every bet.            bet_id -> (x, y)
+        self.layout = None   # TableLayout with the click index, built in _draw_table
+        self.profiler = None # Profiler, when attached clicks are timed and chips counted
+
+        self._draw_table()
+    
+    # This function draws a single cell in the betting table
+    # Modified to support text angle for vertical text on later half of the table
+    def _draw_cell(self, x0, y0, x1, y1, text, fill, bet_id, text_color="white", angle=0):
+        # Creates the rectangle cell for betting
+        # and add it's mapping to cell_map
+        cell = self.create_rectangle(x0, y0, x1, y1, fill=fill, outline="white", width=2)        
+        self.cell_map[cell] = bet_id
+        self.bet_cells[bet_id] = cell
+        self.cell_centers[bet_id] = ((x0 + x1)/2, (y0 + y1)/2)     # Where chips for this bet go
+        
+        # Calculate text position and create text
+        textx, texty = (x0 + x1)//2, (y0 + y1)//2
+        self.create_text(textx, texty, text=text, fill=text_color, 
+                        font=BASE_FONT, angle=angle)
+        return cell
+    
+    # This function draws the entire betting table layout, once when the canvas is created
+    # The geometry comes from Roulette_Layout, which also builds the click index
+    def _draw_table(self):
+        self.delete("all")
+        self.cell_map.clear()
+        self.bet_cells.clear()
+        self.cell_centers.clear()
+        self.drawn_chips.clear()
+
+        self.layout = TableLayout(self.winfo_reqheight())
+        for cell in self.layout.cells:
+            self._draw_cell(cell.x0, cell.y0, cell.x1, cell.y1, cell.text, cell.fill, cell.bet_id,
+                            angle=cell.angle)
+        for zone in self.layout.zones:      # Inside bets have no drawn cell, chips go on the line
+            self.cell_centers[zone.bet_id] = ((zone.x0 + zone.x1)/2, (zone.y0 + zone.y1)/2)
+    
+        self.bind("<Button-1>", self._on_click) # Bind click event to place bets
+        
+    # Draw or update chip on the cell of the given bet
+    # Chips are tagged "chip" so they can all be removed with one delete
+    def _draw_chip(self, bet_id):
+        amt = self.bets[bet_id]
+
+        if bet_id in self.drawn_chips: # Update existing chip, it is already at the cell center
+            _, text_item = self.drawn_chips[bet_id]
+            self.itemconfig(text_item, text=str(amt))           # Update text displayed on screen
+        else:                           # Create new chip
+            cx, cy = self.cell_centers[bet_id]                  # center of cell, cached in _draw_cell
+            chip = self.create_oval(cx-14, cy-14, cx+14, cy+14, # Create chip oval
+                                 fill="gold", outline="black", tags="chip")  
+            text = self.create_text(cx, cy, text=str(amt),      # Create associated text amount
+                                 font=("Arial", 9, "bold"), tags="chip")
+            self.drawn_chips[bet_id] = (chip, text)             # Add chip to drawn_chips map
+    
+    # Handle click events to place bets
+    # The item count for the profiler is taken after the timed section, it is a Tk round trip
+    def _on_click(self, event):
+        if self._place_clicked(event) and self.profiler is not None:
+            self.profiler.count("table_items", len(self.find_all()))
+
+    # The grid index maps the click straight to a bet_id, no canvas item search needed
+    @instrumented("on_click")
+    def _place_clicked(self, event):
+        bet_id = self.layout.bet_at(event.x, event.y)
+        if bet_id is None:
+            return False
+        chip = self.chip_getter()           # Get current chip value from chip_getter function
+        if chip <= 0:
+            return False
+        self.bets[bet_id] = self.bets.get(bet_id, 0) + chip  # Update bets dictionary
+        self.odds.add(bet_id, chip)                          # Only the pockets this bet covers change
+        self._draw_chip(bet_id)                              # Draw or update chip on the cell
+        self._changed()
+        return True
+
+    # Add many bets at once (auto-bet, replays): layout is bet_id -> amount
+    # Every bet is checked before any is applied, so an invalid entry changes nothing.
+    # All bets are applied first, then every touched chip is drawn once
+    def place_bets(self, layout):
+        for bet_id, amount in layout.items():
+            check_bet(bet_id, amount)
+            if bet_id not in self.cell_centers:
+                raise ValueError(f"No cell for bet: {bet_id!r}")
+        for bet_id, amount in layout.items():
+            self.bets[bet_id] = self.bets.get(bet_id, 0) + amount
+            self.odds.add(bet_id, amount)
+        for bet_id in layout:
+            self._draw_chip(bet_id)
+        self._changed()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+    
+    # Getter for bets dictionary   
+    def get_bets(self):
+        return self.bets            
+    
+    # The table layout stays, only the chips are removed
+    def clear_bets(self):
+        self.bets.clear()
+        self.drawn_chips.clear()
+        self.delete("chip")
+        self.odds.clear()
+        self._changed()
+        
+# ------------------------------ Statistics Panel ------------------------------
+
+class StatsPanel(tk.Canvas):
+    """Canvas showing LiveStats: window counts per number (hot ones outlined gold, cold ones
+    blue), dozen and colour shares, streaks, chi-square scores and one small cell per result
+    of the window. The history cells follow the ring buffer of LiveStats and a marker frames
+    the newest result; the strip reads oldest to newest starting right after the marker.
+    The cells are created once; after a spin only the cells that changed are reconfigured
+    and the marker is moved, so a redraw costs the same after a million spins as after ten."""
+
+    CELL, COLS = 44, 10                 # number cells
+    DOT_W, DOT_H, DOT_COLS = 17, 10, 25 # result history cells
+
+    def __init__(self, parent, stats, **kwargs):
+        rows = -(-stats.window // StatsPanel.DOT_COLS)
+        height = 4 * StatsPanel.CELL + 110 + rows * StatsPanel.DOT_H + 10
+        super().__init__(parent, width=StatsPanel.DOT_COLS * StatsPanel.DOT_W + 20, height=height,
+                         bg=DARK_GREEN, highlightthickness=0, **kwargs)
+        self.stats = stats
+        self.number_cells = {}  # n -> (rect, count text)
+        self.dots = []          # ring buffer slot -> rect
+        self.newest = None      # outline framing the cell of the newest result
+        self.newest_shown = False
+        self.hot, self.cold = set(), set()
+        self._build()
+        self.refresh_all()
+
+    def _build(self):
+        c = StatsPanel.CELL
+        for n in range(len(EUROPEAN_ORDER)):
+            x0, y0 = 10 + (n % StatsPanel.COLS) * c, 10 + (n // StatsPanel.COLS) * c
+            rect = self.create_rectangle(x0, y0, x0 + c - 4, y0 + c - 4, fill=number_color(n), outline="white", width=2)
+            self.create_text(x0 + (c-4)/2, y0 + 12, text=str(n), fill="white", font=("Arial", 10, "bold"))
+            count = self.create_text(x0 + (c-4)/2, y0 + 28, text="0", fill="white", font=("Arial", 8))
+            self.number_cells[n] = (rect, count)
+
+        y = 10 + 4 * c + 5
+        self.dozen_text = self.create_text(10, y, anchor="nw", fill="white", font=("Arial", 10))
+        self.color_text = self.create_text(10, y + 22, anchor="nw", fill="white", font=("Arial", 10))
+        self.streak_text = self.create_text(10, y + 44, anchor="nw", fill="white", font=("Arial", 10))
+        self.chi_text = self.create_text(10, y + 66, anchor="nw", fill="white", font=("Arial", 10))
+
+        y0 = y + 95
+        self.dots_top = y0
+        for slot in range(self.stats.window):
+            self.dots.append(self.create_rectangle(*self._dot_box(slot), fill="#333", outline=""))
+        # Created last so it stays on top of the cells, hidden until the first result
+        self.newest = self.create_rectangle(0, 0, 0, 0, outline="white", width=2, state="hidden")
+
+    def _dot_box(self, slot):
+        x = 10 + (slot % StatsPanel.DOT_COLS) * StatsPanel.DOT_W
+        y = self.dots_top + (slot // StatsPanel.DOT_COLS) * StatsPanel.DOT_H
+        return x, y, x + StatsPanel.DOT_W - 2, y + StatsPanel.DOT_H - 2
+
+    # Frame the cell of the newest result
+    def _move_newest(self):
+        if self.stats.spins:
+            slot = (self.stats.spins - 1) % self.stats.window
+            self.coords(self.newest, *self._dot_box(slot))
+            if not self.newest_shown:
+                self.itemconfig(self.newest, state="normal")
+                self.newest_shown = True
+
+    def _update_number(self, n):
+        rect, count = self.number_cells[n]
+        self.itemconfig(count, text=str(self.stats.rolling.numbers[n]))
+        outline = "gold" if n in self.hot else "#4da6ff" if n in self.cold else "white"
+        self.itemconfig(rect, outline=outline)
+
+    def _update_summary(self):
+        st = self.stats
+        self.itemconfig(self.dozen_text, text="Dozens  " + "   ".join(
+            f"{name}: {st.dozen_frequency(d):.1%}" for d, name in ((1, "1st"), (2, "2nd"), (3, "3rd"))))
+        self.itemconfig(self.color_text, text="   ".join(
+            f"{color.title()}: {st.color_frequency(color):.1%}" for color in ("RED", "BLACK", "GREEN")))
+        current = f"{st.streak_color.title()} x{st.streak}" if st.streak else "-"
+        self.itemconfig(self.streak_text, text=f"Streak: {current}   Longest: red {st.longest['RED']}, "
+                                               f"black {st.longest['BLACK']}, green {st.longest['GREEN']}")
+        verdict = "looks fair" if st.chi_square() < CHI2_CRITICAL else "unusual"
+        self.itemconfig(self.chi_text, text=f"Chi-square last {min(st.spins, st.window)}: {st.chi_square():.1f} "
+                                            f"({verdict})   all {st.spins:,}: {st.chi_square(False):.1f}")
+
+    # Redraw everything, used once when the panel opens on a running session
+    def refresh_all(self):
+        self.hot, self.cold = set(self.stats.hot()), set(self.stats.cold())
+        for n in self.number_cells:
+            self._update_number(n)
+        for slot, n in enumerate(self.stats.recent):
+            if n is not None:
+                self.itemconfig(self.dots[slot], fill=number_color(n))
+        self._move_newest()
+        self._update_summary()
+
+    def on_result(self, slot, changed):
+        """Apply the (slot, changed) returned by LiveStats.add: only the new result cell, the
+        numbers whose counts moved and the numbers entering or leaving hot/cold are touched,
+        and the newest-result marker moves to the new cell."""
+        hot, cold = set(self.stats.hot()), set(self.stats.cold())
+        changed = changed | (hot ^ self.hot) | (cold ^ self.cold)
+        self.hot, self.cold = hot, cold
+        for n in changed:
+            self._update_number(n)
+        self.itemconfig(self.dots[slot], fill=number_color(self.stats.recent[slot]))
+        self._move_newest()
+        self._update_summary()
+
+# ------------------------------ Main Runner ------------------------------
+
+class Roulette(tk.Tk):
+    """Main application class that builds the roulette game window, connects all components,
+    manages the player's balance, chip selection, wheel spins, bet validation, and payout handling.
+    This class uses the WheelCanvas, TableCanvas, and user interface controls."""
+
+    def __init__(self, journal_path=None, profile_path=None, raster=False, shared_table=None, engine=None,
+                 wheel_profile=None):
+        # Create main window
+        super().__init__()
+        self.title("Roulette Game")
+        self.configure(bg=DARK_GREEN)
+        
+        # Set default padding for all widgets
+        PADX = 20
+        PADY = 20
+        
+        # Set window dimensions
+        # Get user screen dimensions and create screen-centered window
+        SCREEN_WIDTH = self.winfo_screenwidth()
+        SCREEN_HEIGHT = self.winfo_screenheight()
+        
+        TABLE_WINDOW_WIDTH = TableCanvas.CELL_W*4
+        TABLE_WINDOW_HEIGHT = 14*TableCanvas.CELL_H + 2*PADY
+        
+        WINDOW_WIDTH = 770      # Arbitrary value that fits both canvases
+        WINDOW_HEIGHT = 800     # Arbitrary value that fits both canvases
+        
+        x_pos = (SCREEN_WIDTH // 2) - (WINDOW_WIDTH // 2)       # Find center x position
+        y_pos = (SCREEN_HEIGHT//2) - (WINDOW_HEIGHT//2)  # Find center y position
+        self.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x_pos}+{y_pos}")  # Set window size and position
+        self.resizable(False, False)        # Disable window resizing
+        
+        # Create game state variables
+        # Balance, bets and the spin flag are kept in a RouletteTable, which has no widgets
+        # The wheel and the table share one SpinEngine, so its random source decides every spin
+        # A wheel profile (Roulette_Calibration) reshapes the spins of the given random source
+        probabilities = None
+        if wheel_profile is not None:
+            wheel_profile = load_profile(wheel_profile) if not isinstance(wheel_profile, WheelProfile) else wheel_profile
+            engine = SpinEngine.from_profile(wheel_profile, engine.rng if engine is not None else None)
+            if wheel_profile.bias is not None:
+                probabilities = [w / sum(wheel_profile.bias) for w in wheel_profile.bias]
+        engine = engine if engine is not None else SpinEngine()
+        self.game = RouletteTable(balance=2000, engine=engine)  # Starting balance for the player
+        if journal_path:
+            # Imported here so the game runs without NumPy when no journal is wanted
+            from Roulette_Journal import JournalWriter
+            self.game.journal = JournalWriter(journal_path)
+        self.current_chip = tk.IntVar(value=100)  # Current bet amount
+        self.stats = LiveStats(window=500)        # Fed with every winning number
+        self.shared_table = shared_table          # Roulette_Multiplayer.SharedTable settled by the same spins
+        self.last_round = None                    # RoundResult of the shared table's last round
+        self.stats_window = None                  # Toplevel with the StatsPanel, when open
+
+        # Opt-in instrumentation, written to profile_path (JSON) and a Chrome trace next to it on exit
+        self.profile_path = profile_path
+        self.profiler = Profiler() if profile_path else None
+        
+        # Create and place Wheel and Table canvase
+        self.wheel = WheelCanvas(self, radius=200, raster=raster, engine=engine)
+        self.wheel.grid(row=0, column=0, padx=PADX, pady=PADY)
+        
+        self.table = TableCanvas(self, width=TABLE_WINDOW_WIDTH,
+                                 height=TABLE_WINDOW_HEIGHT, chip_getter=lambda: self.current_chip.get(),
+                                 bets=self.game.bets, on_change=self._update_odds_label,
+                                 probabilities=probabilities)
+        self.table.grid(row=0, column=1, pady=10)
+        self.wheel.profiler = self.table.profiler = self.profiler
+        
+        # Create control pannel below canvases
+        self._build_controls()
+        self.controls_frame.grid(row=2, column=0, columnspan=2)
+        
+        # Result label
+        self.result_var = tk.StringVar(value="Place your bets.")    # Use a StringVar for dynamic text updates
+                                                                    # instead of static label text
+        self.result_lbl = tk.Label(self, textvariable=self.result_var,
+                                   font=BASE_FONT,
+                                   bg=DARK_GREEN, fg="white")
+        self.result_lbl.grid(row=3, column=0, columnspan=2, pady=5)
+
+        # Odds of the current bets, refreshed on every change of the table
+        self.odds_var = tk.StringVar()
+        tk.Label(self, textvariable=self.odds_var, font=("Arial", 10),
+                 bg=DARK_GREEN, fg="white").grid(row=4, column=0, columnspan=2)
+        self._update_odds_label()
+        
+        print('Window width:', WINDOW_WIDTH, 'Window height:', WINDOW_HEIGHT)
+        print('Wheel width:', self.wheel.width, 'Wheel height:', self.wheel.height)
+        print(f'table width: {SCREEN_WIDTH - self.wheel.width}', f'table height: {SCREEN_HEIGHT - 4*PADY}')
+        
+    # Create the control pannel frame for buttons and labels accessible by user
+    def _build_controls(self):
+        # create fram for control pannel of buttons and labels
+        self.controls_frame = tk.Frame(self, bg="#3C1912")
+
+        # Create chip selection radio buttons
+        tk.Label(self.controls_frame, text="Chip:",
+                 bg="#3C1912", fg="white").grid(row=0, column=0, padx=5)
+
+        # Radio buttons for chip selection are a good choice since only one can be selected at a time
+        for j, val in enumerate([1,5,25,100,500, 1000]): 
+            tk.Radiobutton(self.controls_frame, text=str(val),
+                           value=val, variable=self.current_chip,
+                           bg="#3C1912", fg="white", selectcolor="#333"
+                           ).grid(row=0, column=1+j, padx=3)
+            
+        # Turbo checkbox, skips the spin animation
+        self.turbo_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.controls_frame, text="Turbo", variable=self.turbo_var,
+                       bg="#3C1912", fg="white", selectcolor="#333"
+                       ).grid(row=0, column=7, padx=3)
+
+        # Spin button
+        tk.Button(self.controls_frame, text="Spin",
+                  command=self.on_spin, bg=GREEN, fg="white",
+                  font=BASE_FONT,
+                  width=10).grid(row=0, column=8, padx=15, pady=5)
+        
+        # Clear bets button
+        tk.Button(self.controls_frame, text="Clear Bets",
+                  command=self.on_clear, bg=RED, fg="white",
+                  font=BASE_FONT
+                  ).grid(row=0, column=9, padx=5, pady=5)
+    
+        # Statistics button, opens the live statistics window
+        tk.Button(self.controls_frame, text="Stats",
+                  command=self.on_stats, bg="#333", fg="white",
+                  font=BASE_FONT
+                  ).grid(row=0, column=11, padx=5, pady=5)
+
+        # Balance label - Display current balance
+        self.balance_var = tk.StringVar()
+        tk.Label(self.controls_frame, textvariable=self.balance_var,
+                 bg="#3C1912", fg="white",
+                 font=BASE_FONT
+                 ).grid(row=0, column=10, padx=20)
+        self._update_balance_label()
+        
+    # Win probability, expected value, spread and worst case of the bets on the table
+    def _update_odds_label(self):
+        if not hasattr(self, "odds_var"):   # The table reports changes before the label exists
+            return
+        odds = self.table.odds.stats()
+        if not odds.staked:
+            self.odds_var.set("No bets on the table.")
+            return
+        self.odds_var.set(f"Win chance {odds.win_probability:.1%}  |  Expected ${odds.expected_value:+.2f}"
+                          f"  |  Spread \u00b1${odds.std:.2f}  |  Worst case -${odds.worst_loss}")
+
+    # Game state is forwarded to the RouletteTable
+    @property
+    def balance(self):
+        return self.game.balance
+
+    @property
+    def isSpinning(self):
+        return self.game.isSpinning
+
+    def _update_balance_label(self):
+        self.balance_var.set(f"Balance: ${self.balance}")
+    
+    # Close the journal so buffered rounds are written before the window goes away
+    def destroy(self):
+        if self.game.journal is not None:
+            self.game.journal.close()
+        if self.profiler is not None:
+            self.profiler.export_json(self.profile_path)
+            self.profiler.export_chrome_trace(os.path.splitext(self.profile_path)[0] + ".trace.json")
+        super().destroy()
+
+    def _on_lose(self):
+        self.result_var.set("Oh no! You're BROKE! Game over.")
+        if messagebox.askyesno("Game Over", "You're out of money! The casino wins!\nDo you want to quit?"):
+            self.destroy()
+       
+    # Handles operations after the wheel spin is complete
+    # such as computing payout and updating balance before next round
+    def _after_spin(self, win):
+        if self.profiler is None:
+            payout = self.game.settle(win)  # Add payout to balance
+        else:
+            with self.profiler.section("compute_payout"):
+                payout = self.game.settle(win)
+        # Record before anything can end the game, a journal failure only loses the record
+        try:
+            self.game.record(self.wheel.last_result, payout)
+        except (ValueError, OSError) as error:
+            messagebox.showwarning("Journal", f"This round was not recorded: {error}")
+        if self.shared_table is not None:
+            self.last_round = self.shared_table.settle(win)
+        slot, changed = self.stats.add(win)
+        if self.stats_window is not None:
+            self.stats_window.panel.on_result(slot, changed)
+        self._update_balance_label()
+        
+        # Update result label to display winning number and payout
+        color = 'RED' if number_color(win) == RED else 'BLACK' if number_color(win) == BLACK else 'GREEN'
+        if payout > 0:
+            self.result_var.set(f"Result: {win} ({color}) - You won ${payout}!")
+        elif self.balance == 0:
+            self._on_lose()
+        else:
+            self.result_var.set(f"Result: {win} ({color}) - You lost. Better luck next time!")
+    
+    # Stats button handler: open the statistics window, or bring it to the front
+    def on_stats(self):
+        if self.stats_window is not None:
+            self.stats_window.lift()
+            return
+        self.stats_window = tk.Toplevel(self)
+        self.stats_window.title("Statistics")
+        self.stats_window.configure(bg=DARK_GREEN)
+        self.stats_window.panel = StatsPanel(self.stats_window, self.stats)
+        self.stats_window.panel.pack(padx=10, pady=10)
+        self.stats_window.protocol("WM_DELETE_WINDOW", self._close_stats)
+
+    def _close_stats(self):
+        self.stats_window.destroy()
+        self.stats_window = None
+
+    # Clear bets button handler
+    def on_clear(self):
+        if self.isSpinning: return # Prevent clearing bets while spinning
+        self.table.clear_bets()
+        if self.balance != 0:
+            self.result_var.set("Bets cleared. Place your bets.")
+        else: 
+            self.result_var.set("You're out of money! Game over.")
+            if messagebox.askyesno("Game Over", "You're out of money! The casino wins!\nDo you want to quit?"):
+                self.destroy()
+    
+    # Spin button handler
+    def on_spin(self):
+        if self.isSpinning: return # Prevent multiple spins at once
+        
+        bets = self.table.get_bets()
+        total_bet = sum(bets.values())
+        
+        # Validate bets
+        if self.balance <= 0:
+            if messagebox.askyesno("Game Over", "You're out of money! The casino wins!\nDo you want to quit?"):
+                self.destroy()
+            return
+        if total_bet == 0:
+            messagebox.showwarning("No Bets", "Please place at least one bet before spinning.")
+            return
+        if total_bet > self.balance:
+            messagebox.showwarning("Insufficient Balance", "You do not have enough balance to cover your bets.")
+            return
+        
+        # Deduct total bet from balance
+        self.game.begin_spin()
+        self._update_balance_label()
+        
+        # Start spinning the wheel
+        self.result_var.set("Spinning the wheel...")
+        # Call spin_wheel with callback to _after_spin
+        self.wheel.turbo = self.turbo_var.get()
+        self.wheel.spin_wheel(on_done=self._after_spin)
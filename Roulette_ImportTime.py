@@ -0,0 +1,78 @@
+"""Cold-start cost of the headless and GUI import paths.
+Every sample is a fresh interpreter, so nothing is cached between runs except the OS file
+cache and the .pyc files. The GUI path only imports the window classes, it opens no window.
+
+Example:
+    python Roulette_ImportTime.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# What a batch worker does vs what the game does before opening its window
+PATHS = {
+    "baseline": "pass",
+    "headless": "import Roulette_Project; Roulette_Project.number_color(17); Roulette_Project.SpinEngine()",
+    "gui": "import Roulette_Project; Roulette_Project.Roulette",
+}
+
+# Report probe: prints whether tkinter got imported by the snippet
+_PROBE = "\nimport sys; print('tkinter' in sys.modules)"
+
+def _run(code, *flags):
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=HERE, check=True,
+                          capture_output=True, text=True)
+
+def time_path(code, runs):
+    """Wall-clock seconds of `runs` fresh interpreters running `code`."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(code)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def slowest_imports(code, top=5):
+    """(cumulative microseconds, module) of the slowest top-level imports, from -X importtime."""
+    rows = []
+    for line in _run(code, "-X", "importtime").stderr.splitlines():
+        parts = line.split("|")
+        # Lines look like "import time:  self [us] |  cumulative | imported package", nesting is indented
+        if len(parts) == 3 and parts[1].strip().isdigit() and not parts[2].startswith("   "):
+            rows.append((int(parts[1]), parts[2].strip()))
+    return sorted(rows, reverse=True)[:top]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold import time of the game modules.")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per path")
+    parser.add_argument("--path", choices=sorted(PATHS), action="append")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.path or list(PATHS):
+        code = PATHS[name]
+        try:
+            tk_loaded = _run(code + _PROBE).stdout.strip() == "True"
+        except subprocess.CalledProcessError as error:
+            print(f"{name}: failed ({error.stderr.strip().splitlines()[-1]})")
+            continue
+        samples = time_path(code, args.runs)
+        results[name] = statistics.median(samples)
+        print(f"{name}: median {1000 * results[name]:.1f} ms, min {1000 * min(samples):.1f} ms "
+              f"over {args.runs} runs, tkinter {'loaded' if tk_loaded else 'not loaded'}")
+        for micros, module in slowest_imports(code):
+            print(f"    {micros / 1000:8.1f} ms  {module}")
+    if "baseline" in results:
+        base = results["baseline"]
+        for name, seconds in results.items():
+            if name != "baseline":
+                print(f"{name} over bare interpreter: {1000 * (seconds - base):+.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""Append-only binary journal of played rounds.
+Every round is one fixed-width record: seed and index of the spin in the random stream,
+initial velocities, final angles, winning number, payout and the position of its bets in
+a second file. The bets are rows of (round, bet index, amount) appended to `<path>.bets`,
+so a round costs one row per chip instead of a slot for every possible bet. The reader
+memory-maps both files and exposes them as NumPy structured arrays without copying them.
+
+File layout:
+    b"RLJ1" | header length (uint32, little endian) | JSON header | padding | records...
+    <path>.bets: bet rows, no header
+The JSON header stores the list of bet_ids, so bet indexes keep their meaning when new
+bets are added to the game later. Version 1 and 2 files kept the bets in slots inside the
+record; they are still read, but not appended to.
+
+Example:
+    python Roulette_Journal.py spins.rlj
+"""
+
+import argparse
+import json
+import os
+import struct
+import time
+
+import numpy as np
+
+from Roulette_Rules import BET_IDS
+
+MAGIC = b"RLJ1"
+VERSION = 3
+
+# One row per bet of a round, a round's rows are contiguous
+BET_DTYPE = np.dtype([("round", "<u8"), ("bet_index", "<u2"), ("amount", "<i4")])
+
+def record_dtype(version=VERSION, bet_slots=0):
+    # Packed little-endian record. Versions before 3 hold `bet_slots` bets inline,
+    # unused slots have amount 0
+    spin = [("spin", "<u8")] if version >= 2 else []
+    if version >= 3:
+        bets = [("bets_offset", "<u8")]
+    else:
+        bets = [("bet_index", "<u2", (bet_slots,)), ("bet_amount", "<i4", (bet_slots,))]
+    return np.dtype([
+        ("round", "<u8"),
+        ("seed", "<u8"),
+        *spin,
+        ("wheel_vel", "<f8"), ("ball_vel", "<f8"),
+        ("wheel_decel", "<f8"), ("ball_decel", "<f8"),
+        ("wheel_angle", "<f8"), ("ball_angle", "<f8"),
+        ("winner", "u1"),
+        ("n_bets", "<u2"),
+        ("total_bet", "<i8"),
+        ("payout", "<i8"),
+        *bets,
+    ])
+
+def bets_path(path):
+    """Path of the file holding the bet rows of the journal at `path`."""
+    return os.fspath(path) + ".bets"
+
+def _encode_header(bet_ids):
+    header = json.dumps({"version": VERSION, "bet_ids": [list(bet_id) for bet_id in bet_ids]}).encode()
+    size = len(MAGIC) + 4 + len(header)
+    header += b" " * (-size % 8)     # Keep records 8-byte aligned for the memory map
+    return MAGIC + struct.pack("<I", len(header)) + header
+
+def read_header(path):
+    """Header dict of a journal plus the byte offset where the records start."""
+    with open(path, "rb") as f:
+        if f.read(4) != MAGIC:
+            raise ValueError(f"{path} is not a roulette journal.")
+        (length,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(length))
+    # JSON turns tuples into lists, split bets have a tuple value
+    header["bet_ids"] = [(bet_type, tuple(val) if isinstance(val, list) else val)
+                         for bet_type, val in header["bet_ids"]]
+    return header, 8 + length
+
+def _memmap(path, dtype, offset, count):
+    if count:
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+    return np.zeros(0, dtype=dtype)
+
+# ------------------------------ Writer ------------------------------
+
+class JournalWriter:
+    """Appends round records to a journal file and their bets to `<path>.bets`. Records are
+    buffered and written with one fsync every `fsync_every` rounds (and on flush/close)."""
+
+    def __init__(self, path, fsync_every=1000):
+        self.dtype = record_dtype()
+        bets_file = bets_path(path)
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            header, offset = read_header(path)
+            if header["version"] != VERSION:
+                raise ValueError(f"{path} is a version {header['version']} journal, start a new file to record rounds.")
+            bet_ids = header["bet_ids"]
+            self.round = (os.path.getsize(path) - offset) // self.dtype.itemsize
+            # Drop a record torn by a crash, so new records start on a record boundary,
+            # and the bet rows past the last complete record
+            os.truncate(path, offset + self.round * self.dtype.itemsize)
+            self.bets_written = 0
+            if self.round:
+                with open(path, "rb") as f:
+                    f.seek(offset + (self.round - 1) * self.dtype.itemsize)
+                    last = np.frombuffer(f.read(self.dtype.itemsize), dtype=self.dtype)[0]
+                self.bets_written = int(last["bets_offset"]) + int(last["n_bets"])
+            size = os.path.getsize(bets_file) if os.path.exists(bets_file) else 0
+            if size < self.bets_written * BET_DTYPE.itemsize:
+                raise ValueError(f"{bets_file} is missing bets of recorded rounds.")
+            self._bets_file = open(bets_file, "ab")
+            self._bets_file.truncate(self.bets_written * BET_DTYPE.itemsize)
+            self._file = open(path, "ab")
+        else:
+            bet_ids = BET_IDS
+            self.round = 0
+            self.bets_written = 0
+            self._file = open(path, "wb")
+            self._file.write(_encode_header(bet_ids))
+            self._bets_file = open(bets_file, "wb")
+        self.path = path
+        self.bet_index = {bet_id: i for i, bet_id in enumerate(bet_ids)}
+        self.fsync_every = fsync_every
+        self._buffer = np.zeros(fsync_every, dtype=self.dtype)
+        self._pending = 0
+        self._bet_rows = []     # (round, bet index, amount) of the buffered records
+
+    def append(self, result, bets, payout, seed=0, spin=0):
+        """Record one round from its SpinResult, the layout (bet_id -> amount) and the payout.
+        `seed` and `spin` locate the spin in a seeded stream (PhiloxSource(seed).seek(spin))."""
+        if self._file.closed:
+            raise ValueError("The journal is closed.")
+        try:
+            rows = [(self.round, self.bet_index[bet_id], amount) for bet_id, amount in bets.items()]
+        except KeyError as error:
+            raise ValueError(f"Bet {error.args[0]!r} is not in this journal's bet list.")
+        record = self._buffer[self._pending]
+        record["round"] = self.round
+        record["seed"] = seed
+        record["spin"] = spin
+        (record["wheel_vel"], record["ball_vel"],
+         record["wheel_decel"], record["ball_decel"]) = result.params
+        record["wheel_angle"] = result.wheel_angle
+        record["ball_angle"] = result.ball_angle
+        record["winner"] = result.winner
+        record["n_bets"] = len(rows)
+        record["total_bet"] = sum(bets.values())
+        record["payout"] = payout
+        record["bets_offset"] = self.bets_written + len(self._bet_rows)
+        self._bet_rows += rows
+        self.round += 1
+        self._pending += 1
+        if self._pending == self.fsync_every:
+            self.flush()
+
+    def flush(self):
+        # Bets first: a record on disk always finds its bets, bet rows without a record are
+        # dropped when the journal is reopened
+        if self._bet_rows:
+            self._bets_file.write(np.array(self._bet_rows, dtype=BET_DTYPE).tobytes())
+            self.bets_written += len(self._bet_rows)
+            self._bet_rows = []
+        self._bets_file.flush()
+        os.fsync(self._bets_file.fileno())
+        if self._pending:
+            self._file.write(self._buffer[:self._pending].tobytes())
+            self._pending = 0
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            self._bets_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ------------------------------ Reader ------------------------------
+
+class Journal:
+    """Read-only view of a journal. `records` and `bet_rows` are memory-mapped structured
+    arrays, so scanning a column only touches the pages it needs and nothing is copied up front."""
+
+    def __init__(self, path):
+        self.header, offset = read_header(path)
+        self.bet_ids = self.header["bet_ids"]
+        self.version = self.header["version"]
+        self.dtype = record_dtype(self.version, self.header.get("bet_slots", 0))
+        count = (os.path.getsize(path) - offset) // self.dtype.itemsize   # Ignore a torn last record
+        self.records = _memmap(path, self.dtype, offset, count)
+        self.bet_rows = np.zeros(0, dtype=BET_DTYPE)
+        if self.version >= 3 and os.path.exists(bets_path(path)):
+            rows = os.path.getsize(bets_path(path)) // BET_DTYPE.itemsize
+            self.bet_rows = _memmap(bets_path(path), BET_DTYPE, 0, rows)
+
+    def __len__(self):
+        return len(self.records)
+
+    # Layout (bet_id -> amount) of one recorded round
+    def bets(self, i):
+        record = self.records[i]
+        n = int(record["n_bets"])
+        if self.version >= 3:
+            rows = self.bet_rows[int(record["bets_offset"]):int(record["bets_offset"]) + n]
+            indexes, amounts = rows["bet_index"], rows["amount"]
+        else:
+            indexes, amounts = record["bet_index"][:n], record["bet_amount"][:n]
+        return {self.bet_ids[int(index)]: int(amount) for index, amount in zip(indexes, amounts)}
+
+    def winner_counts(self):
+        return np.bincount(self.records["winner"], minlength=37)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize a roulette journal.")
+    parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    journal = Journal(args.path)
+    counts = journal.winner_counts()
+    staked = int(journal.records["total_bet"].sum())
+    paid = int(journal.records["payout"].sum())
+    seconds = time.perf_counter() - start
+    print(f"{len(journal):,} rounds ({len(journal.bet_rows):,} bets) scanned in {seconds:.2f}s")
+    print(f"Staked {staked:,}, paid {paid:,}, house result {staked - paid:+,}")
+    print("Most frequent numbers: " + ", ".join(f"{n} ({counts[n]:,})" for n in np.argsort(counts)[::-1][:5]))
+
+if __name__ == "__main__":
+    main()
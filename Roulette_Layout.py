@@ -0,0 +1,164 @@
+"""Geometry of the betting table and a grid index for click hit-testing.
+Nothing here needs tkinter, so recorded click streams can be replayed headlessly."""
+
+from bisect import insort
+from typing import NamedTuple
+
+from Roulette_Rules import GREEN, RED, BLACK, number_color
+
+CELL_W, CELL_H = 60, 40     # cell size
+PAD_X, PAD_Y = 10, 10
+
+ZONE = 6                    # half thickness of the split/corner/street/line hit zones
+
+class Zone(NamedTuple):
+    """Invisible hit zone on the lines between cells for an inside bet."""
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    bet_id: tuple
+
+class Cell(NamedTuple):
+    """One bettable rectangle of the table and how it is drawn."""
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    text: str
+    fill: str
+    bet_id: tuple
+    angle: int = 0      # 90 for vertical text
+
+# ------------------------------ Table Geometry ------------------------------
+
+def table_cells(height):
+    """All cells of the table for a canvas of the given height, in drawing order."""
+    cells = []
+    cell_w, cell_h = CELL_W, CELL_H
+    y_offset = height//2 - (PAD_Y + cell_h*7)   # Helps center the table vertically
+
+    # 0 cell across the top
+    cells.append(Cell(PAD_X, PAD_Y + y_offset, PAD_X + cell_w*3, PAD_Y + cell_h + y_offset,
+                      "0", GREEN, ("number", 0)))
+
+    # Numbers grid (1..36) in 12 rows (top to bottom), 3 columns (left to right: 1st column is "1,4,7,...")
+    start_x = PAD_X                         # start position from where to draw table
+    start_y = PAD_Y + cell_h + y_offset
+    for row in range(12):
+        for col in range(3):
+            num = 3*row + col + 1
+            x0 = start_x + col * cell_w
+            y0 = start_y + row * cell_h
+            cells.append(Cell(x0, y0, x0 + cell_w, y0 + cell_h, str(num), number_color(num), ('number', num)))
+
+    # The 2:1 bets cells row
+    for col in range(3):
+        x0 = start_x + col * cell_w
+        y0 = start_y + 12 * cell_h
+        cells.append(Cell(x0, y0, x0 + cell_w, y0 + cell_h, "2 to 1", GREEN, ('column', col+1)))
+
+    # The Dozens column, vertical text
+    dozens = ["1st 12", "2nd 12", "3rd 12"]
+    for row in range(3):
+        x0 = start_x + 3 * cell_w
+        y0 = start_y + 4*row * cell_h
+        cells.append(Cell(x0, y0, x0 + cell_w*0.5, y0 + 4*cell_h, dozens[row], GREEN, ('dozen', row+1), 90))
+
+    # Final column for Even, Red, Low, etc.
+    texts = ["1 to 18", "EVEN", "RED", "BLACK", "ODD", "19 to 36"]
+    bet_types = ['range', 'parity', 'color', 'color', 'parity', 'range']
+    fills = {"RED": RED, "BLACK": BLACK}
+    for row in range(6):
+        x0 = start_x + 3.5 * cell_w
+        y0 = start_y + row * 2 * cell_h
+        cells.append(Cell(x0, y0, x0 + cell_w*0.5, y0 + 2*cell_h, texts[row],
+                          fills.get(texts[row], GREEN), (bet_types[row], texts[row]), 90))
+    return cells
+
+def inside_zones(height):
+    """Hit zones of the inside bets, on the borders and corners of the number cells.
+    Streets and six-lines are on the outer (left) edge of the grid, like on a real table."""
+    zones = []
+    w, h, z = CELL_W, CELL_H, ZONE
+    start_x = PAD_X
+    start_y = PAD_Y + h + height//2 - (PAD_Y + h*7)     # top of the 1-2-3 row, as in table_cells
+
+    # Along the 0 cell: splits 0-1, 0-2, 0-3, trios 0-1-2 and 0-2-3, and the first four 0-1-2-3
+    for col in range(3):
+        x0 = start_x + col * w
+        zones.append(Zone(x0 + z, start_y - z, x0 + w - z, start_y + z, ('split', (0, col + 1))))
+    for trio in (1, 2):
+        x = start_x + trio * w
+        zones.append(Zone(x - z, start_y - z, x + z, start_y + z, ('trio', trio)))
+    zones.append(Zone(start_x - z, start_y - z, start_x + z, start_y + z, ('corner', 0)))
+
+    for row in range(12):
+        y0 = start_y + row * h
+        first = 3*row + 1
+        zones.append(Zone(start_x - z, y0 + z, start_x + z, y0 + h - z, ('street', first)))
+        for col in range(3):
+            n = first + col
+            x0 = start_x + col * w
+            if col < 2:     # split with the number to the right
+                x = x0 + w
+                zones.append(Zone(x - z, y0 + z, x + z, y0 + h - z, ('split', (n, n + 1))))
+            if row < 11:    # split with the number below
+                y = y0 + h
+                zones.append(Zone(x0 + z, y - z, x0 + w - z, y + z, ('split', (n, n + 3))))
+            if col < 2 and row < 11:
+                x, y = x0 + w, y0 + h
+                zones.append(Zone(x - z, y - z, x + z, y + z, ('corner', n)))
+        if row < 11:
+            y = y0 + h
+            zones.append(Zone(start_x - z, y - z, start_x + z, y + z, ('line', first)))
+    return zones
+
+# ------------------------------ Hit Testing ------------------------------
+
+class HitIndex:
+    """Uniform grid over the table. Every grid bucket lists the zones that touch it, smallest
+    first, so a point is resolved by checking the few zones of one bucket. When zones
+    overlap the smallest one wins, so small split/corner zones sit on top of the cells."""
+
+    def __init__(self, bucket=10):
+        self.bucket = bucket
+        self.grid = {}      # (bx, by) -> [(area, order, x0, y0, x1, y1, bet_id), ...]
+        self.count = 0
+
+    def add(self, x0, y0, x1, y1, bet_id):
+        zone = ((x1 - x0) * (y1 - y0), self.count, x0, y0, x1, y1, bet_id)
+        self.count += 1
+        b = self.bucket
+        for bx in range(int(x0 // b), int(x1 // b) + 1):
+            for by in range(int(y0 // b), int(y1 // b) + 1):
+                insort(self.grid.setdefault((bx, by), []), zone)
+
+    def lookup(self, x, y):
+        """bet_id of the zone under (x, y), or None."""
+        for _, _, x0, y0, x1, y1, bet_id in self.grid.get((int(x // self.bucket), int(y // self.bucket)), ()):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return bet_id
+        return None
+
+class TableLayout:
+    """Cells and inside-bet zones of the table for a canvas height, plus the hit index built from them."""
+
+    def __init__(self, height, bucket=10):
+        self.cells = table_cells(height)
+        self.zones = inside_zones(height)
+        self.index = HitIndex(bucket)
+        for area in self.cells + self.zones:
+            self.index.add(area.x0, area.y0, area.x1, area.y1, area.bet_id)
+
+    def bet_at(self, x, y):
+        return self.index.lookup(x, y)
+
+    def replay(self, clicks, bets=None):
+        """Apply recorded clicks (x, y, chip) the way TableCanvas does, returns bet_id -> amount."""
+        bets = {} if bets is None else bets
+        for x, y, chip in clicks:
+            bet_id = self.bet_at(x, y)
+            if bet_id is not None and chip > 0:
+                bets[bet_id] = bets.get(bet_id, 0) + chip
+        return bets
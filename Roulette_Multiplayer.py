@@ -0,0 +1,167 @@
+"""Many players at one wheel.
+A SharedTable keeps every player's balance and layout in NumPy arrays: stakes is a
+players x bets matrix in BET_IDS order. A round is one spin (from the engine, or the winner of
+a WheelCanvas spin) and one vectorized settlement: only the columns of the bets that cover
+the winning pocket are read, every player's payout is summed from them, and the new
+balances replace the old ones in one assignment.
+
+Example:
+    python Roulette_Multiplayer.py --players 10000 --bets 50 --rounds 20
+"""
+
+import argparse
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from Roulette_Rules import BET_IDS, BET_INDEX, BET_UNITS, BET_COVERAGE, POCKET_BETS
+from Roulette_Engine import SpinEngine
+
+UNITS = np.array([BET_UNITS[bet_id] for bet_id in BET_IDS])
+COVERAGE = np.array([BET_COVERAGE[bet_id] for bet_id in BET_IDS])
+# Pocket -> indexes (BET_IDS order) of the bets that win on it
+WINNING_BETS = [np.array([BET_INDEX[bet_id] for bet_id in bets]) for bets in POCKET_BETS]
+
+class RoundResult(NamedTuple):
+    """Outcome of one round for every player (arrays indexed by player)."""
+    round: int
+    winner: int
+    staked: np.ndarray
+    payout: np.ndarray      # amount returned, stakes of winning bets included
+    balance: np.ndarray     # balance after the round
+    seconds: float          # time spent settling
+
+    @property
+    def net(self):
+        return self.payout - self.staked
+
+    def player(self, i):
+        return {"staked": int(self.staked[i]), "payout": int(self.payout[i]),
+                "net": int(self.payout[i] - self.staked[i]), "balance": int(self.balance[i])}
+
+    def summary(self):
+        net = self.net
+        return {"round": self.round, "winner": self.winner, "players": len(self.staked),
+                "betting": int((self.staked > 0).sum()), "winners": int((net > 0).sum()),
+                "staked": int(self.staked.sum()), "paid": int(self.payout.sum()),
+                "house_net": int(self.staked.sum() - self.payout.sum())}
+
+class SharedTable:
+    """One wheel shared by many players, each with their own balance and bets."""
+
+    def __init__(self, players=0, balance=2000, engine=None):
+        self.engine = engine if engine is not None else SpinEngine()
+        self.balance = np.full(players, balance, dtype=np.int64)
+        self.stakes = np.zeros((players, len(BET_IDS)), dtype=np.int64)
+        self.staked = np.zeros(players, dtype=np.int64)     # row sums of stakes, kept up to date
+        self.names = [f"player {i + 1}" for i in range(players)]
+        self.round = 0
+        self.wheel_angle = 0.0
+        self.ball_angle = 0.0
+
+    def __len__(self):
+        return len(self.balance)
+
+    def add_player(self, name=None, balance=2000):
+        """Seat a new player, returns the player's index."""
+        self.balance = np.append(self.balance, np.int64(balance))
+        self.stakes = np.vstack([self.stakes, np.zeros((1, len(BET_IDS)), dtype=np.int64)])
+        self.staked = np.append(self.staked, np.int64(0))
+        self.names.append(name or f"player {len(self.names) + 1}")
+        return len(self.balance) - 1
+
+    def total_bets(self):
+        return self.staked.copy()
+
+    # ------------------------------ Betting ------------------------------
+
+    def place_bet(self, player, bet_id, amount):
+        if bet_id not in BET_INDEX:
+            raise ValueError(f"Unknown bet: {bet_id!r}")
+        self.place_bets(np.array([player]), np.array([BET_INDEX[bet_id]]), np.array([amount]))
+
+    def place_bets(self, players, bets, amounts):
+        """Add many bets at once: parallel arrays of player index, bet index (BET_IDS order) and
+        amount. Either every bet is placed or, when one is invalid, none is."""
+        players, bets, amounts = (np.asarray(v, dtype=np.int64) for v in (players, bets, amounts))
+        if ((players < 0) | (players >= len(self))).any():
+            raise ValueError("Unknown player.")
+        if ((bets < 0) | (bets >= len(BET_IDS))).any():
+            raise ValueError("Unknown bet.")
+        if (amounts <= 0).any():
+            raise ValueError("Bet amount must be positive.")
+        if (amounts % UNITS[bets]).any():
+            raise ValueError("Bet amounts must be multiples of the bet's unit (5 for neighbours).")
+        totals = self.staked + np.bincount(players, weights=amounts, minlength=len(self)).astype(np.int64)
+        short = totals > self.balance
+        if short.any():
+            raise ValueError(f"Not enough balance to cover the bets of {int(short.sum())} players.")
+        np.add.at(self.stakes, (players, bets), amounts)
+        self.staked = totals
+
+    def clear_bets(self, player=None):
+        if player is None:
+            self.stakes[:] = 0
+            self.staked[:] = 0
+        else:
+            self.stakes[player] = 0
+            self.staked[player] = 0
+
+    # ------------------------------ Settlement ------------------------------
+
+    def settle(self, winner):
+        """Pay every player's bets for the winning number in one pass and clear the bets."""
+        start = time.perf_counter()
+        columns = WINNING_BETS[winner]
+        staked = self.staked
+        # Amounts are multiples of the bet unit, so amount * 36 // coverage is exact
+        payout = (self.stakes[:, columns] * 36 // COVERAGE[columns]).sum(axis=1)
+        balance = self.balance - staked + payout
+        self.balance = balance      # New balances replace the old ones in one assignment
+        self.stakes[:] = 0
+        self.staked = np.zeros(len(balance), dtype=np.int64)
+        self.round += 1
+        return RoundResult(self.round, winner, staked, payout, balance.copy(), time.perf_counter() - start)
+
+    # One authoritative spin for the whole table, then settlement
+    def play(self):
+        result = self.engine.spin(self.wheel_angle, self.ball_angle)
+        self.wheel_angle, self.ball_angle = result.wheel_angle, result.ball_angle
+        return result, self.settle(result.winner)
+
+# Random layouts for a benchmark: `bets` distinct bets per player, small valid amounts
+def random_layouts(players, bets, rng):
+    chosen = rng.random((players, len(BET_IDS))).argsort(axis=1)[:, :bets]
+    amounts = UNITS[chosen] * rng.integers(1, 5, size=chosen.shape)
+    return np.repeat(np.arange(players), bets), chosen.ravel(), amounts.ravel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Settle many players at one wheel.")
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--bets", type=int, default=50, help="distinct bets per player")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    table = SharedTable(players=args.players, balance=1_000_000)
+    place_seconds = settle_seconds = 0.0
+    for _ in range(args.rounds):
+        layouts = random_layouts(args.players, args.bets, rng)
+        start = time.perf_counter()
+        table.place_bets(*layouts)
+        place_seconds += time.perf_counter() - start
+        _, result = table.play()
+        settle_seconds += result.seconds
+    summary = result.summary()
+    bets = args.players * args.bets
+    print(f"{args.players:,} players x {args.bets} bets, {args.rounds} rounds")
+    print(f"Settlement {1000 * settle_seconds / args.rounds:.2f} ms per round "
+          f"({bets * args.rounds / settle_seconds:,.0f} bets/sec), "
+          f"placing {1000 * place_seconds / args.rounds:.2f} ms per round")
+    print(f"Last round: winner {summary['winner']}, {summary['winners']:,} players ahead, "
+          f"staked {summary['staked']:,}, paid {summary['paid']:,}, house {summary['house_net']:+,}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Odds and expected value of a bet layout, kept up to date as bets are placed.
+LayoutOdds holds the amount returned for each of the 37 pockets. Adding a chip only touches
+the pockets the bet covers, so a click costs the same with one chip or hundreds on the table.
+The summary (win probability, expected value, variance, worst case) is derived from that
+vector and memoized in an LRU keyed by a layout hash that is also updated per bet: the hash
+is the XOR of one term per (bet, amount), so it does not depend on the order bets were placed.
+This module must not import tkinter.
+
+Example:
+    python Roulette_Odds.py --bet color RED 10 --bet split 17-20 5
+"""
+
+import argparse
+import math
+from collections import OrderedDict
+from typing import NamedTuple
+
+from Roulette_Rules import BET_INDEX, BET_MASKS, BET_UNITS, bet_return
+
+POCKETS = 37
+
+class OddsStats(NamedTuple):
+    """Summary of a layout. Net results are payout minus the total stake."""
+    staked: int
+    win_probability: float      # P(net result > 0)
+    hit_probability: float      # P(some bet wins, payout > 0)
+    expected_value: float       # expected net result
+    variance: float
+    worst_loss: int             # largest possible loss (0 when no outcome loses)
+    best_win: int               # largest possible net win
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+def _pockets(mask):
+    return [n for n in range(POCKETS) if mask >> n & 1]
+
+# Pockets covered by every bet, so adding a chip walks only those
+BET_POCKETS = {bet_id: _pockets(mask) for bet_id, mask in BET_MASKS.items()}
+
+class LayoutOdds:
+    """Incremental odds of one layout. `probabilities` gives P(pocket n) for n = 0..36
+    (a fair wheel by default)."""
+
+    def __init__(self, probabilities=None, cache_size=1024):
+        self.probabilities = list(probabilities) if probabilities is not None else [1 / POCKETS] * POCKETS
+        self.cache_size = cache_size
+        self.bets = {}
+        self.returns = [0] * POCKETS    # payout for each winning pocket
+        self.staked = 0
+        self.key = 0                    # order-independent hash of self.bets
+        self._cache = OrderedDict()     # (key, staked) -> OddsStats
+        self.hits = self.misses = 0
+
+    def set_amount(self, bet_id, amount):
+        """Set the amount on one bet (0 removes it), updating returns and hash for that bet only."""
+        if bet_id not in BET_INDEX:
+            raise ValueError(f"Unknown bet: {bet_id!r}")
+        if amount < 0 or amount % BET_UNITS[bet_id]:
+            raise ValueError(f"Bet amount must be a non-negative multiple of {BET_UNITS[bet_id]} for {bet_id!r}.")
+        old = self.bets.get(bet_id, 0)
+        if amount == old:
+            return
+        change = bet_return(bet_id, amount) - bet_return(bet_id, old)
+        for n in BET_POCKETS[bet_id]:
+            self.returns[n] += change
+        self.staked += amount - old
+        if old:
+            self.key ^= hash((BET_INDEX[bet_id], old))
+        if amount:
+            self.key ^= hash((BET_INDEX[bet_id], amount))
+            self.bets[bet_id] = amount
+        else:
+            del self.bets[bet_id]
+
+    def add(self, bet_id, amount):
+        self.set_amount(bet_id, self.bets.get(bet_id, 0) + amount)
+
+    def remove(self, bet_id):
+        self.set_amount(bet_id, 0)
+
+    def clear(self):
+        self.bets.clear()
+        self.returns = [0] * POCKETS
+        self.staked = 0
+        self.key = 0
+
+    # Replace the layout with bets (bet_id -> amount), touching only the bets that differ
+    def set_layout(self, bets):
+        for bet_id in [b for b in self.bets if b not in bets]:
+            self.remove(bet_id)
+        for bet_id, amount in bets.items():
+            self.set_amount(bet_id, amount)
+
+    def stats(self):
+        cache_key = (self.key, self.staked)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(cache_key)
+            return cached
+        self.misses += 1
+        stats = self._compute()
+        self._cache[cache_key] = stats
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return stats
+
+    def _compute(self):
+        staked, p = self.staked, self.probabilities
+        net = [r - staked for r in self.returns]
+        mean = sum(pn * x for pn, x in zip(p, net))
+        variance = sum(pn * x * x for pn, x in zip(p, net)) - mean * mean
+        return OddsStats(staked,
+                         sum(pn for pn, x in zip(p, net) if x > 0),
+                         sum(pn for pn, r in zip(p, self.returns) if r > 0),
+                         mean, max(0.0, variance),
+                         max(0, -min(net)), max(0, max(net)))
+
+def _parse_value(bet_type, text):
+    # Same conventions as the simulation CLI: "17-20" for a split, names for outside bets
+    if bet_type == "split":
+        return tuple(int(v) for v in text.split("-"))
+    return int(text) if text.isdigit() else text
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Odds and expected value of a bet layout.")
+    parser.add_argument("--bet", nargs=3, action="append", metavar=("TYPE", "VALUE", "AMOUNT"), required=True)
+    args = parser.parse_args(argv)
+
+    odds = LayoutOdds()
+    for bet_type, value, amount in args.bet:
+        odds.add((bet_type, _parse_value(bet_type, value)), int(amount))
+    s = odds.stats()
+    print(f"Staked {s.staked}, win probability {s.win_probability:.2%}, any bet hits {s.hit_probability:.2%}")
+    print(f"Expected result {s.expected_value:+.3f} (std {s.std:.2f}), worst loss {s.worst_loss}, best win {s.best_win}")
+
+if __name__ == "__main__":
+    main()
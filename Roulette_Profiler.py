@@ -0,0 +1,190 @@
+"""Opt-in instrumentation for the game loop.
+A Profiler keeps the most recent timings of every named section in a fixed-size ring
+buffer plus a power-of-two histogram of all samples, and the latest values of counters
+such as the number of canvas items. Nothing is recorded unless a Profiler is attached,
+and an attached one only costs two perf_counter calls and a list store per section.
+
+Reports are JSON (count, mean, p50/p95/p99, max and histogram per section) and the Chrome
+trace format, which opens in chrome://tracing or https://ui.perfetto.dev.
+
+Example:
+    python Roulette_Profiler.py profile.json --compare baseline.json
+"""
+
+import argparse
+import functools
+import json
+import os
+import time
+from collections import deque
+
+HIST_BUCKETS = 32   # bucket i counts samples below 2**i microseconds
+
+# ------------------------------ Ring Buffers ------------------------------
+
+class SectionStats:
+    """Timings of one section: the last `capacity` (start, duration) pairs in seconds and a
+    histogram of every sample since the profiler was created."""
+
+    def __init__(self, capacity):
+        self.starts = [0.0] * capacity
+        self.durations = [0.0] * capacity
+        self.count = 0
+        self.total = 0.0
+        self.histogram = [0] * HIST_BUCKETS
+
+    def add(self, start, duration):
+        i = self.count % len(self.durations)
+        self.starts[i] = start
+        self.durations[i] = duration
+        self.count += 1
+        self.total += duration
+        self.histogram[min(HIST_BUCKETS - 1, int(duration * 1e6).bit_length())] += 1
+
+    # Samples still in the buffer, oldest first
+    def recent(self):
+        n = min(self.count, len(self.durations))
+        first = self.count - n
+        order = [(first + k) % len(self.durations) for k in range(n)]
+        return [self.starts[i] for i in order], [self.durations[i] for i in order]
+
+    def percentile(self, q):
+        _, durations = self.recent()
+        if not durations:
+            return 0.0
+        ordered = sorted(durations)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def summary(self):
+        _, durations = self.recent()
+        ms = 1000
+        return {"count": self.count,
+                "mean_ms": ms * self.total / self.count if self.count else 0.0,
+                "p50_ms": ms * self.percentile(50),
+                "p95_ms": ms * self.percentile(95),
+                "p99_ms": ms * self.percentile(99),
+                "max_ms": ms * max(durations, default=0.0),
+                "histogram_us": {f"<{2 ** i}": c for i, c in enumerate(self.histogram) if c}}
+
+# ------------------------------ Profiler ------------------------------
+
+class Profiler:
+    """Collects section timings and counters. Attach one to the canvases and the window
+    (their `profiler` attribute) to turn instrumentation on."""
+
+    def __init__(self, capacity=2048):
+        self.capacity = capacity
+        self.sections = {}      # name -> SectionStats
+        self.counters = {}      # name -> deque of the last `capacity` (time, value) pairs
+        self.origin = time.perf_counter()
+
+    def record(self, name, start, end):
+        stats = self.sections.get(name)
+        if stats is None:
+            stats = self.sections[name] = SectionStats(self.capacity)
+        stats.add(start, end - start)
+
+    def count(self, name, value):
+        values = self.counters.get(name)
+        if values is None:
+            values = self.counters[name] = deque(maxlen=self.capacity)
+        values.append((time.perf_counter(), value))
+
+    def section(self, name):
+        return _Section(self, name)
+
+    def reset(self):
+        self.sections.clear()
+        self.counters.clear()
+        self.origin = time.perf_counter()
+
+    def summary(self):
+        report = {name: stats.summary() for name, stats in sorted(self.sections.items())}
+        counters = {name: {"last": values[-1][1], "max": max(v for _, v in values)}
+                    for name, values in sorted(self.counters.items()) if values}
+        return {"sections": report, "counters": counters}
+
+    def export_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def chrome_trace(self):
+        """Recent samples as Chrome trace events: one complete event per section sample
+        and one counter event per counter value, timestamps in microseconds."""
+        events = []
+        pid = os.getpid()
+        for name, stats in self.sections.items():
+            for start, duration in zip(*stats.recent()):
+                events.append({"name": name, "ph": "X", "pid": pid, "tid": 1,
+                               "ts": (start - self.origin) * 1e6, "dur": duration * 1e6})
+        for name, values in self.counters.items():
+            for when, value in values:
+                events.append({"name": name, "ph": "C", "pid": pid,
+                               "ts": (when - self.origin) * 1e6, "args": {name: value}})
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+class _Section:
+    # Context manager timing one block into a profiler
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+
+# Method decorator: times the call into self.profiler when one is attached
+def instrumented(name):
+    def decorate(method):
+        @functools.wraps(method)
+        def timed(self, *args, **kwargs):
+            profiler = self.profiler
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                profiler.record(name, start, time.perf_counter())
+        return timed
+    return decorate
+
+# ------------------------------ Report ------------------------------
+
+def _print_report(summary, baseline=None):
+    print(f"{'section':<16}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in summary["sections"].items():
+        line = (f"{name:<16}{stats['count']:>8}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+                f"{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}")
+        old = (baseline or {}).get("sections", {}).get(name)
+        if old and old["p95_ms"]:
+            line += f"   p95 {stats['p95_ms'] / old['p95_ms'] - 1:+.1%} vs baseline"
+        print(line)
+    for name, counter in summary["counters"].items():
+        print(f"{name}: last {counter['last']}, max {counter['max']}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print a profile written by the game.")
+    parser.add_argument("path", help="JSON profile (Roulette(profile_path=...) or ROULETTE_PROFILE)")
+    parser.add_argument("--compare", default=None, help="baseline profile to compare p95 against")
+    args = parser.parse_args(argv)
+
+    with open(args.path) as f:
+        summary = json.load(f)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    _print_report(summary, baseline)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Random sources for the spin engine.
+A source hands out spin initial conditions, one at a time (spin_params, used by SpinEngine)
+or in blocks (params_batch, used by the batch tools). Every spin consumes four uniforms in
+the order of Roulette_Engine.draw_params, so both ways give the same spins in the same order.
+
+    PhiloxSource(seed)   counter-based and reproducible; spin k can be regenerated with seek(k)
+    CryptoSource()       os.urandom, for real-money play; not reproducible
+    ReplaySource(path)   the recorded initial conditions of a Roulette_Journal file, in order
+
+Example:
+    python Roulette_RNG.py --spins 1000000 --journal spins.rlj
+"""
+
+import argparse
+import os
+import random
+import time
+
+import numpy as np
+
+from Roulette_Engine import DEFAULT_RANGES, SpinEngine, SpinParams
+from Roulette_Simulation import SpinBatch
+
+# ------------------------------ Sources ------------------------------
+
+class SpinSource:
+    """Base class. Subclasses implement uniforms(n), an (n, 4) array of floats in [0, 1),
+    one row per spin. Scalar draws are served from a buffered block of rows."""
+
+    name = "source"
+    replays = False
+
+    def __init__(self, block=4096):
+        self.block = block
+        self._rows = np.empty((0, 4))
+        self._pos = 0
+        self.spins = 0          # spins handed out so far
+
+    def uniforms(self, n):
+        raise NotImplementedError
+
+    # Next n rows of the stream, buffered rows first
+    def _take(self, n):
+        buffered = self._rows[self._pos:self._pos + n]
+        self._pos += len(buffered)
+        self.spins += n
+        if len(buffered) == n:
+            return buffered
+        return np.concatenate([buffered, self.uniforms(n - len(buffered))])
+
+    # Next row of the buffered block
+    def _row(self):
+        if self._pos == len(self._rows):
+            self._rows, self._pos = self.uniforms(self.block), 0
+        self.spins += 1
+        u = self._rows[self._pos]
+        self._pos += 1
+        return u
+
+    # One uniform for a draw besides the spin itself (SpinEngine's bias test). It uses a whole
+    # row, so row k of the stream is still what seek(k) regenerates.
+    def random(self):
+        return float(self._row()[0])
+
+    def spin_params(self, ranges=DEFAULT_RANGES):
+        u = self._row()
+        return SpinParams(ranges.wheel_speed[0] + float(u[0]) * ranges.wheel_speed[1],
+                          -ranges.ball_speed[0] - float(u[1]) * ranges.ball_speed[1],
+                          ranges.wheel_decel[0] + float(u[2]) * ranges.wheel_decel[1],
+                          ranges.ball_decel[0] + float(u[3]) * ranges.ball_decel[1])
+
+    def params_batch(self, n, ranges=DEFAULT_RANGES):
+        u = self._take(n)
+        return SpinBatch(ranges.wheel_speed[0] + u[:, 0] * ranges.wheel_speed[1],
+                         -ranges.ball_speed[0] - u[:, 1] * ranges.ball_speed[1],
+                         ranges.wheel_decel[0] + u[:, 2] * ranges.wheel_decel[1],
+                         ranges.ball_decel[0] + u[:, 3] * ranges.ball_decel[1])
+
+class PhiloxSource(SpinSource):
+    """Seeded Philox4x64 stream. One Philox counter step yields exactly the four uniforms of
+    one spin, so seek(k) jumps straight to spin k without generating the ones before it."""
+
+    name = "philox"
+
+    def __init__(self, seed=0, block=4096):
+        super().__init__(block)
+        self.seed = seed
+        self.seek(0)
+
+    def seek(self, spin):
+        bit_generator = np.random.Philox(key=self.seed)
+        bit_generator.advance(spin)
+        self._generator = np.random.Generator(bit_generator)
+        self._rows, self._pos = np.empty((0, 4)), 0
+        self.spins = spin
+
+    def uniforms(self, n):
+        return self._generator.random((n, 4))
+
+class CryptoSource(SpinSource):
+    """Uniforms from os.urandom: 53 random bits per float, like random.SystemRandom."""
+
+    name = "crypto"
+
+    def uniforms(self, n):
+        bits = np.frombuffer(os.urandom(32 * n), dtype=np.uint64).reshape(n, 4)
+        return (bits >> np.uint64(11)) * 2.0**-53
+
+class ReplaySource(SpinSource):
+    """Replays the initial conditions recorded in a journal, round by round. The ranges are
+    ignored: the recorded values are returned as they were played."""
+
+    name = "replay"
+    replays = True      # SpinEngine plays the recorded spins as they are, without its bias
+
+    def __init__(self, journal, start=0):
+        super().__init__()
+        if isinstance(journal, (str, os.PathLike)):
+            from Roulette_Journal import Journal
+            journal = Journal(journal)
+        self.records = journal.records
+        self.spins = start
+
+    def _rounds(self, n):
+        if self.spins + n > len(self.records):
+            raise ValueError(f"The journal has {len(self.records)} rounds, cannot replay round {self.spins + n}.")
+        rows = self.records[self.spins:self.spins + n]
+        self.spins += n
+        return rows
+
+    def spin_params(self, ranges=DEFAULT_RANGES):
+        row = self._rounds(1)[0]
+        return SpinParams(float(row["wheel_vel"]), float(row["ball_vel"]),
+                          float(row["wheel_decel"]), float(row["ball_decel"]))
+
+    def params_batch(self, n, ranges=DEFAULT_RANGES):
+        rows = self._rounds(n)
+        return SpinBatch(*(np.array(rows[field]) for field in ("wheel_vel", "ball_vel", "wheel_decel", "ball_decel")))
+
+def make_source(spec):
+    """Source from a short spec: "philox:SEED", "crypto" or "replay:JOURNAL"."""
+    name, _, arg = spec.partition(":")
+    if name == "philox":
+        return PhiloxSource(int(arg or 0))
+    if name == "crypto":
+        return CryptoSource()
+    if name == "replay" and arg:
+        return ReplaySource(arg)
+    raise ValueError(f"Unknown random source {spec!r}, use philox:SEED, crypto or replay:JOURNAL.")
+
+# ------------------------------ Throughput ------------------------------
+
+def _rate(fn, spins):
+    start = time.perf_counter()
+    fn()
+    return spins / (time.perf_counter() - start)
+
+def throughput(spins=1_000_000, block=65536, journal=None):
+    """Spin parameters per second for each backend, scalar (one spin at a time through
+    SpinEngine) and in bulk (params_batch in blocks)."""
+    scalar = min(spins, 200_000)    # scalar draws are slow, a smaller sample is enough
+
+    def one_by_one(engine):
+        return lambda: [engine.draw_params() for _ in range(scalar)]
+
+    def in_blocks(source):
+        def run():
+            for first in range(0, spins, block):
+                source.params_batch(min(block, spins - first))
+        return run
+
+    rates = {"random.Random (legacy)": _rate(one_by_one(SpinEngine(random.Random(1))), scalar),
+             "random.SystemRandom": _rate(one_by_one(SpinEngine(random.SystemRandom())), scalar),
+             "philox, scalar": _rate(one_by_one(SpinEngine(PhiloxSource(1))), scalar),
+             "philox, bulk": _rate(in_blocks(PhiloxSource(1)), spins),
+             "crypto, scalar": _rate(one_by_one(SpinEngine(CryptoSource())), scalar),
+             "crypto, bulk": _rate(in_blocks(CryptoSource()), spins)}
+    if journal is not None:
+        source = ReplaySource(journal)
+        n = len(source.records)
+        rates["replay, scalar"] = _rate(lambda: [source.spin_params() for _ in range(min(n, scalar))], min(n, scalar))
+        source = ReplaySource(journal)
+        rates["replay, bulk"] = _rate(lambda: source.params_batch(n), n)
+    return rates
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the throughput of the spin random sources.")
+    parser.add_argument("--spins", type=int, default=1_000_000)
+    parser.add_argument("--block", type=int, default=65536, help="spins per bulk block")
+    parser.add_argument("--journal", default=None, help="journal file to include the replay source")
+    args = parser.parse_args(argv)
+
+    for name, rate in throughput(args.spins, args.block, args.journal).items():
+        print(f"{name:<24}{rate:>16,.0f} spins/sec")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Game rules and constants shared by the GUI and the headless tools.
+This module must not import tkinter so it can be used without a display."""
+
+import math
+
+# ------------------------------ Configuration & Helpers ------------------------------
+
+EUROPEAN_ORDER = [
+    0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23,
+    10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26
+]  # clockwise
+
+#Which numbers associate with which number
+RED_NUMBERS = {1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36}
+BLACK_NUMBERS = set(range(1, 37)) - RED_NUMBERS
+SECTOR_ANGLE = 2 * math.pi / (len(BLACK_NUMBERS) + len(RED_NUMBERS)+1)  # radians per sector
+
+#Colour Choices
+DARK_GREEN = "#01431E"
+GREEN = '#016D29'
+RED = '#E0080B'
+BLACK = '#000000'
+
+def number_color(n):
+    if n == 0:
+        return GREEN
+    return RED if n in RED_NUMBERS else BLACK
+
+# Real casino horizontal layout (3 rows, 12 columns), each row is one column bet
+ROW1 = [1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34]
+ROW2 = [2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35]
+ROW3 = [3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36]
+
+# ------------------------------ Bets ------------------------------
+
+# A bet_id is (bet_type, value), e.g. ('number', 17), ('split', (17, 20)) or ('dozen', 2)
+# Inside bets on the number grid (vertical table, 3 numbers per row):
+#   split      (a, b)  two touching numbers, including 0-1, 0-2 and 0-3
+#   street     n       the row n, n+1, n+2 (n = 1, 4, ..., 34)
+#   trio       1 or 2  0-1-2 and 0-2-3
+#   corner     n       the square n, n+1, n+3, n+4 (n in the first two columns), 0 is 0-1-2-3
+#   line       n       two rows, n to n+5 (n = 1, 4, ..., 31)
+#   neighbours n       n and two numbers on each side of it on the wheel (racetrack bet)
+# Every bet is a bitmask over the 37 pockets (bit n set when n wins) and pays from its
+# coverage: a winning bet returns amount * 36 / (numbers covered), stake included.
+NEIGHBOURS = 2      # numbers on each side of a neighbours bet
+
+def bet_mask(bet_id):
+    """Bitmask of the winning numbers of a bet."""
+    bet_type, val = bet_id
+    if bet_type == 'number':
+        numbers = [val]
+    elif bet_type == 'color':
+        numbers = RED_NUMBERS if val == 'RED' else BLACK_NUMBERS
+    elif bet_type == 'parity':
+        numbers = [n for n in range(1, 37) if n % 2 == (0 if val == 'EVEN' else 1)]
+    elif bet_type == 'range':
+        numbers = range(1, 19) if val == '1 to 18' else range(19, 37)
+    elif bet_type == 'dozen':
+        numbers = range(12*(val-1) + 1, 12*val + 1)
+    elif bet_type == 'column':
+        numbers = (ROW1, ROW2, ROW3)[val-1]
+    elif bet_type == 'split':
+        numbers = val
+    elif bet_type == 'street':
+        numbers = [val, val+1, val+2]
+    elif bet_type == 'trio':
+        numbers = [0, val, val+1]
+    elif bet_type == 'corner':
+        numbers = [0, 1, 2, 3] if val == 0 else [val, val+1, val+3, val+4]
+    elif bet_type == 'line':
+        numbers = range(val, val+6)
+    elif bet_type == 'neighbours':
+        i = EUROPEAN_ORDER.index(val)
+        numbers = [EUROPEAN_ORDER[(i + k) % len(EUROPEAN_ORDER)] for k in range(-NEIGHBOURS, NEIGHBOURS+1)]
+    else:
+        raise ValueError(f"Unknown bet type: {bet_type!r}")
+    mask = 0
+    for n in numbers:
+        mask |= 1 << n
+    return mask
+
+# Winning numbers covered by a bet
+def bet_pockets(bet_id):
+    mask = BET_MASKS[bet_id]
+    return frozenset(n for n in range(37) if mask >> n & 1)
+
+# ------------------------------ Bet Coverage Index ------------------------------
+
+# Every bet in a fixed order: the cells of the table first, then the inside bets
+BET_IDS = ([('number', n) for n in range(37)]
+           + [('column', c) for c in (1, 2, 3)]
+           + [('dozen', d) for d in (1, 2, 3)]
+           + [('range', '1 to 18'), ('parity', 'EVEN'), ('color', 'RED'),
+              ('color', 'BLACK'), ('parity', 'ODD'), ('range', '19 to 36')]
+           + [('split', (0, n)) for n in (1, 2, 3)]
+           + [('split', (n, n+1)) for n in range(1, 37) if n % 3 != 0]
+           + [('split', (n, n+3)) for n in range(1, 34)]
+           + [('trio', 1), ('trio', 2), ('corner', 0)]
+           + [('street', n) for n in range(1, 35, 3)]
+           + [('corner', n) for n in range(1, 33) if n % 3 != 0]
+           + [('line', n) for n in range(1, 32, 3)]
+           + [('neighbours', n) for n in EUROPEAN_ORDER])
+BET_INDEX = {bet_id: i for i, bet_id in enumerate(BET_IDS)}    # bet_id -> position in BET_IDS
+
+# Compiled once from the bet definitions
+BET_MASKS = {bet_id: bet_mask(bet_id) for bet_id in BET_IDS}                      # bet_id -> pocket bitmask
+BET_COVERAGE = {bet_id: bin(mask).count("1") for bet_id, mask in BET_MASKS.items()}  # bet_id -> numbers covered
+# Reverse map: POCKET_BETS[n] lists every bet that wins when n comes up
+POCKET_BETS = [tuple(bet_id for bet_id in BET_IDS if BET_MASKS[bet_id] >> n & 1) for n in range(37)]
+
+# Smallest amount step for a bet: neighbours cover 5 numbers, which does not divide 36,
+# so their amount must be a multiple of 5 for the payout to be a whole number
+BET_UNITS = {bet_id: coverage // math.gcd(36, coverage) for bet_id, coverage in BET_COVERAGE.items()}
+
+# Raise ValueError unless amount is a valid stake for the bet
+def check_bet(bet_id, amount):
+    if bet_id not in BET_INDEX:
+        raise ValueError(f"Unknown bet: {bet_id!r}")
+    if amount <= 0:
+        raise ValueError("Bet amount must be positive.")
+    if amount % BET_UNITS[bet_id]:
+        raise ValueError(f"Bet amount must be a multiple of {BET_UNITS[bet_id]} for {bet_id!r}.")
+
+# Amount returned when the bet wins, stake included
+def bet_return(bet_id, amount):
+    return amount * 36 // BET_COVERAGE[bet_id]
+
+# bet_id -> amount returned per unit staked for each winning number 0..36, for array settlement
+PAYOUT_TABLE = {bet_id: tuple(36 / BET_COVERAGE[bet_id] if mask >> n & 1 else 0.0 for n in range(37))
+                for bet_id, mask in BET_MASKS.items()}
+
+def compute_payout(bets, winning_number):
+    """Total amount returned for a layout (bet_id -> amount), stakes of winning bets included.
+    Only the bets that cover the winning number are looked at, so a large layout costs no
+    more than the few bets that can win; a small layout is tested bet by bet on the bitmask.
+    Raises ValueError for a bet that is not in BET_IDS, whatever the size of the layout."""
+    if not bets.keys() <= BET_MASKS.keys():
+        raise ValueError(f"Unknown bet: {next(iter(bets.keys() - BET_MASKS.keys()))!r}")
+    winning = POCKET_BETS[winning_number]
+    if len(bets) <= len(winning):
+        bit = 1 << winning_number
+        return sum(bet_return(bet_id, amount) for bet_id, amount in bets.items() if BET_MASKS[bet_id] & bit)
+    return sum(bet_return(bet_id, bets[bet_id]) for bet_id in winning if bet_id in bets)
@@ -0,0 +1,261 @@
+"""Multi-table roulette server.
+Runs many RouletteTable games in one process with asyncio. Every table loops through
+rounds: a betting window, one spin from the headless engine, then settlement.
+
+Clients talk newline-delimited JSON over TCP or a Unix socket. Requests:
+    {"op": "join", "table": 7}
+    {"op": "bet", "table": 7, "bet": ["number", 17], "amount": 10}
+    {"op": "bet", "table": 7, "bet": ["split", [17, 20]], "amount": 10}
+    {"op": "clear", "table": 7}
+    {"op": "state", "table": 7}
+Every request gets one reply {"ok": true, ...} or {"ok": false, "error": "..."}.
+Joined clients also receive {"event": "open", ...} when a betting window opens and
+{"event": "result", ...} after each settled round.
+
+Examples:
+    python Roulette_Server.py serve --tables 1000 --window 0.5
+    python Roulette_Server.py loadtest --tables 1000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+from Roulette_Engine import RouletteTable, SpinEngine
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+LATENCY_SAMPLES = 10_000    # settlement latencies kept for the percentiles (the most recent ones)
+
+# ------------------------------ Server ------------------------------
+
+class TableRoom:
+    """One table on the server: its game state, the joined clients and the round counter."""
+
+    def __init__(self, table_id, balance):
+        self.table_id = table_id
+        self.game = RouletteTable(balance=balance)
+        self.clients = set()        # StreamWriters that joined this table
+        self.round = 0
+        self.betting_open = False
+
+    def state(self):
+        return {"table": self.table_id, "round": self.round, "balance": self.game.balance,
+                "bets": [[list(bet_id), amount] for bet_id, amount in self.game.bets.items()],
+                "open": self.betting_open}
+
+class RouletteServer:
+    """Schedules betting rounds for many tables concurrently and serves the JSON protocol."""
+
+    def __init__(self, tables=100, betting_window=1.0, balance=2000, engine=None):
+        self.engine = engine if engine is not None else SpinEngine()  # One engine for all tables
+        self.rooms = {}
+        for table_id in range(tables):
+            room = TableRoom(table_id, balance)
+            room.game.engine = self.engine
+            self.rooms[table_id] = room
+        self.betting_window = betting_window
+        self.settle_latencies = deque(maxlen=LATENCY_SAMPLES)  # seconds from closing bets to sending the result
+        self.rounds_played = 0          # rounds that settled bets, empty tables still spin but are not counted
+        self._tasks = []
+
+    # ------------------------------ Round scheduling ------------------------------
+
+    def start(self):
+        self._tasks = [asyncio.create_task(self._run_table(room)) for room in self.rooms.values()]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run_table(self, room):
+        while True:
+            room.round += 1
+            room.betting_open = True
+            await self._broadcast(room, {"event": "open", "table": room.table_id, "round": room.round})
+            await asyncio.sleep(self.betting_window)
+            room.betting_open = False
+
+            start = time.perf_counter()
+            message, settled = self._play_round(room)
+            await self._broadcast(room, message)
+            if settled:
+                self.settle_latencies.append(time.perf_counter() - start)
+                self.rounds_played += 1
+            # Let other tables run even when the betting window is 0
+            await asyncio.sleep(0)
+
+    # Result message of the round and whether any bets were settled
+    def _play_round(self, room):
+        game = room.game
+        message = {"event": "result", "table": room.table_id, "round": room.round}
+        settled = True
+        try:
+            result, payout = game.play()
+        except ValueError:
+            # No bets (or not enough balance), the wheel still spins for the table
+            result, payout = game.engine.spin(game.wheel_angle, game.ball_angle), 0
+            game.wheel_angle, game.ball_angle = result.wheel_angle, result.ball_angle
+            settled = False
+        message.update(winner=result.winner, payout=payout, balance=game.balance)
+        game.bets.clear()
+        return message, settled
+
+    async def _broadcast(self, room, message):
+        if not room.clients:
+            return
+        data = (json.dumps(message) + "\n").encode()
+        for writer in list(room.clients):
+            if writer.is_closing():
+                room.clients.discard(writer)
+                continue
+            writer.write(data)
+        await asyncio.gather(*(w.drain() for w in room.clients), return_exceptions=True)
+
+    # ------------------------------ Protocol ------------------------------
+
+    def _room(self, request):
+        try:
+            return self.rooms[int(request["table"])]
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Unknown table.")
+
+    def handle(self, request, writer=None):
+        """Apply one request and return the reply dict."""
+        if not isinstance(request, dict):
+            raise ValueError("A request must be a JSON object.")
+        op = request.get("op")
+        room = self._room(request)
+        if op == "join":
+            if writer is not None:
+                room.clients.add(writer)
+            return {"ok": True, **room.state()}
+        if op == "state":
+            return {"ok": True, **room.state()}
+        if not room.betting_open:
+            raise ValueError("Betting is closed for this round.")
+        if op == "bet":
+            bet_type, val = request["bet"]
+            if isinstance(val, list):   # split values arrive as JSON lists
+                val = tuple(val)
+            amount = request["amount"]
+            # Only whole numbers: int() would truncate 1.9 and overflow on Infinity
+            if not isinstance(amount, int) or isinstance(amount, bool):
+                raise ValueError("Bet amount must be a whole number.")
+            if room.game.total_bet() + amount > room.game.balance:
+                raise ValueError("You do not have enough balance to cover your bets.")
+            room.game.place_bet((bet_type, val), amount)
+            return {"ok": True, "table": room.table_id, "total_bet": room.game.total_bet()}
+        if op == "clear":
+            room.game.clear_bets()
+            return {"ok": True, "table": room.table_id}
+        raise ValueError(f"Unknown op: {op!r}")
+
+    async def _serve_client(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    reply = self.handle(json.loads(line), writer)
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {"ok": False, "error": str(error)}
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for room in self.rooms.values():
+                room.clients.discard(writer)
+            writer.close()
+
+    async def listen(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        if unix_path:
+            return await asyncio.start_unix_server(self._serve_client, path=unix_path, limit=1 << 20)
+        return await asyncio.start_server(self._serve_client, host, port, limit=1 << 20)
+
+# ------------------------------ Load Test ------------------------------
+
+async def _connect(host, port, unix_path):
+    if unix_path:
+        return await asyncio.open_unix_connection(unix_path, limit=1 << 20)
+    return await asyncio.open_connection(host, port, limit=1 << 20)
+
+async def _player(table_id, rounds, host, port, unix_path):
+    # One client per table: bet on every open round and wait for `rounds` results, returns
+    # the number of results received
+    reader, writer = await _connect(host, port, unix_path)
+    writer.write((json.dumps({"op": "join", "table": table_id}) + "\n").encode())
+    settled = 0
+    while settled < rounds:
+        message = json.loads(await reader.readline())
+        if message.get("event") == "open":
+            writer.write((json.dumps({"op": "bet", "table": table_id,
+                                      "bet": ["color", "RED"], "amount": 1}) + "\n").encode())
+        elif message.get("event") == "result":
+            settled += 1
+    writer.close()
+    return settled
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+async def load_test(tables=100, rounds=20, window=0.05, host=DEFAULT_HOST, port=0, unix_path=None):
+    """Start a server in this process, connect one client per table and play `rounds` rounds.
+    Returns rounds/sec and the p50/p99 settlement latency (bets closed to result sent)."""
+    server = RouletteServer(tables=tables, betting_window=window)
+    listener = await server.listen(host, port, unix_path)
+    if not unix_path:
+        port = listener.sockets[0].getsockname()[1]
+
+    start = time.perf_counter()
+    server.start()
+    # Throughput counts the results the players received, not rounds spun on tables nobody watched
+    received = sum(await asyncio.gather(*(_player(t, rounds, host, port, unix_path) for t in range(tables))))
+    seconds = time.perf_counter() - start
+    await server.stop()
+    listener.close()
+    await listener.wait_closed()
+
+    return {"tables": tables, "rounds": received, "seconds": seconds,
+            "rounds_per_sec": received / seconds,
+            "settle_p50_ms": 1000 * percentile(server.settle_latencies, 50),
+            "settle_p99_ms": 1000 * percentile(server.settle_latencies, 99)}
+
+async def _serve_forever(args):
+    server = RouletteServer(tables=args.tables, betting_window=args.window)
+    listener = await server.listen(args.host, args.port, args.unix)
+    server.start()
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Serving {args.tables} tables on {where}, betting window {args.window}s")
+    async with listener:
+        await listener.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-table roulette server.")
+    parser.add_argument("mode", choices=["serve", "loadtest"])
+    parser.add_argument("--tables", type=int, default=100)
+    parser.add_argument("--window", type=float, default=None, help="betting window in seconds")
+    parser.add_argument("--rounds", type=int, default=20, help="rounds per table (loadtest)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", default=None, help="Unix socket path instead of TCP")
+    args = parser.parse_args(argv)
+
+    if args.mode == "serve":
+        args.window = 1.0 if args.window is None else args.window
+        asyncio.run(_serve_forever(args))
+    else:
+        window = 0.05 if args.window is None else args.window
+        stats = asyncio.run(load_test(args.tables, args.rounds, window, args.host, 0, args.unix))
+        print(f"{stats['rounds']:,} rounds on {stats['tables']} tables in {stats['seconds']:.2f}s "
+              f"({stats['rounds_per_sec']:,.0f} rounds/sec)")
+        print(f"Settlement latency p50 {stats['settle_p50_ms']:.3f} ms, p99 {stats['settle_p99_ms']:.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Batch Monte Carlo simulation of the roulette wheel with NumPy.
+Evaluates the same closed-form physics as Roulette_Engine over whole arrays of spins
+and settles a fixed bet layout against every outcome.
+
+Example:
+    python Roulette_Simulation.py --spins 10000000 --seed 1 --bet color RED 10 --bet number 17 1
+    python Roulette_Simulation.py --spins 1000000000 --seed 1 --workers 0
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from Roulette_Engine import DEFAULT_RANGES, STEP, STOP_VEL, TWO_PI
+from Roulette_Rules import EUROPEAN_ORDER, SECTOR_ANGLE, bet_pockets, bet_return, check_bet
+
+ORDER = np.array(EUROPEAN_ORDER, dtype=np.int8)     # sector index -> number
+
+# ------------------------------ Vectorized Physics ------------------------------
+
+class SpinBatch(NamedTuple):
+    """Initial conditions of many spins, one array per SpinParams field."""
+    wheel_vel: np.ndarray
+    ball_vel: np.ndarray
+    wheel_decel: np.ndarray
+    ball_decel: np.ndarray
+
+def draw_params_batch(n, rng, ranges=DEFAULT_RANGES):
+    # Same ranges as Roulette_Engine.draw_params, rng is a numpy Generator or a Roulette_RNG source
+    if hasattr(rng, "params_batch"):
+        return rng.params_batch(n, ranges)
+    return SpinBatch(ranges.wheel_speed[0] + rng.random(n) * ranges.wheel_speed[1],
+                     -ranges.ball_speed[0] - rng.random(n) * ranges.ball_speed[1],
+                     ranges.wheel_decel[0] + rng.random(n) * ranges.wheel_decel[1],
+                     ranges.ball_decel[0] + rng.random(n) * ranges.ball_decel[1])
+
+# Array versions of Roulette_Engine.moving_steps and stop_step. The division is off by at
+# most one step after rounding, so a single correction pass matches the scalar loops.
+def moving_steps_batch(speed, decel):
+    k = np.maximum(0, np.ceil(speed / decel) - 1)
+    k -= (k > 0) & (speed - k * decel <= 0)
+    k += speed - (k + 1) * decel > 0
+    return k
+
+def stop_step_batch(speed, decel):
+    k = np.maximum(1, np.floor((speed - STOP_VEL) / decel) + 1)
+    k -= (k > 1) & (speed - (k - 1) * decel < STOP_VEL)
+    k += speed - k * decel >= STOP_VEL
+    return k
+
+def travel_batch(speed, decel, steps):
+    m = np.minimum(steps, moving_steps_batch(speed, decel))
+    return STEP * (m * speed - decel * m * (m + 1) / 2)
+
+def winners_batch(wheel_angle, ball_angle):
+    # Same sector mapping as Roulette_Engine.resolve_winner
+    rel_angle = (ball_angle - wheel_angle) % TWO_PI
+    idx = (rel_angle // SECTOR_ANGLE).astype(np.intp) % len(EUROPEAN_ORDER)
+    return ORDER[idx]
+
+def settle_batch(batch, wheel_angle=0.0, ball_angle=0.0):
+    """Final wheel angles, ball angles, step counts and winning numbers for a SpinBatch."""
+    wheel_speed, ball_speed = batch.wheel_vel, -batch.ball_vel
+    steps = np.maximum(stop_step_batch(wheel_speed, batch.wheel_decel),
+                       stop_step_batch(ball_speed, batch.ball_decel))
+    wheel_final = (wheel_angle + travel_batch(wheel_speed, batch.wheel_decel, steps)) % TWO_PI
+    ball_final = (ball_angle - travel_batch(ball_speed, batch.ball_decel, steps)) % TWO_PI
+    return wheel_final, ball_final, steps.astype(np.int64), winners_batch(wheel_final, ball_final)
+
+# ------------------------------ Settlement ------------------------------
+
+# Amount returned by a layout for each winning number 0..36, stake included. Uses the same
+# whole-number returns as the table (bet_return), so it agrees with bet_pnl.
+def pocket_returns(layout):
+    returns = np.zeros(37, dtype=np.int64)
+    for bet_id, amount in layout.items():
+        returns[sorted(bet_pockets(bet_id))] += bet_return(bet_id, amount)
+    return returns
+
+# Same checks as RouletteTable.place_bet, before any spins are simulated
+def _check_layout(layout):
+    for bet_id, amount in (layout or {}).items():
+        check_bet(bet_id, amount)
+
+class SimulationResult(NamedTuple):
+    spins: int
+    pocket_counts: np.ndarray   # times each number 0..36 won
+    staked: float               # total amount bet over all spins
+    returned: float             # total amount paid back, stake included
+    max_return: float           # largest single-spin return (payout exposure)
+    bet_pnl: dict               # bet_id -> player's net result over all spins
+    seconds: float
+
+    @property
+    def spins_per_sec(self):
+        return self.spins / self.seconds if self.seconds else float("inf")
+
+    @property
+    def house_edge(self):
+        return 1 - self.returned / self.staked if self.staked else 0.0
+
+# Spins are split into fixed-size blocks. Block i always draws from the i-th child stream of
+# the master seed, so the outcome only depends on the seed, never on how blocks are shared out.
+def _block_rng(entropy, block):
+    return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(block,)))
+
+def _block_sizes(spins, block_spins):
+    return [min(block_spins, spins - start) for start in range(0, spins, block_spins)]
+
+# Pocket histogram of one block, runs in the worker processes
+def _simulate_block(job):
+    entropy, block, n = job
+    _, _, _, winners = settle_batch(draw_params_batch(n, _block_rng(entropy, block)))
+    return np.bincount(winners, minlength=37)
+
+# Settle a layout against a pocket histogram. Integer counts make the merge exact.
+def _summarize(spins, counts, layout, seconds):
+    layout = layout or {}
+    bet_pnl = {bet_id: bet_return(bet_id, amount) * int(counts[sorted(bet_pockets(bet_id))].sum()) - amount * spins
+               for bet_id, amount in layout.items()}
+    returns = pocket_returns(layout)
+    staked = sum(layout.values()) * spins
+    return SimulationResult(spins, counts, float(staked), float(staked + sum(bet_pnl.values())),
+                            float(returns[counts > 0].max(initial=0.0)), bet_pnl, seconds)
+
+def simulate(spins, layout=None, seed=None, block_spins=1_000_000):
+    """Simulate `spins` spins from a resting wheel and settle `layout` (bet_id -> amount) on each.
+    Runs block by block so memory stays bounded for very large runs."""
+    _check_layout(layout)
+    entropy = np.random.SeedSequence(seed).entropy
+    counts = np.zeros(37, dtype=np.int64)
+    start = time.perf_counter()
+    for block, n in enumerate(_block_sizes(spins, block_spins)):
+        counts += _simulate_block((entropy, block, n))
+    return _summarize(spins, counts, layout, time.perf_counter() - start)
+
+def run_parallel(spins, layout=None, seed=None, workers=None, block_spins=1_000_000):
+    """Same as simulate(), with the blocks shared out over a process pool.
+    For a given seed and block size the result is identical for any number of workers."""
+    _check_layout(layout)
+    entropy = np.random.SeedSequence(seed).entropy
+    jobs = [(entropy, block, n) for block, n in enumerate(_block_sizes(spins, block_spins))]
+    counts = np.zeros(37, dtype=np.int64)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for block_counts in pool.map(_simulate_block, jobs):
+            counts += block_counts
+    return _summarize(spins, counts, layout, time.perf_counter() - start)
+
+# Parse a bet value from the command line, numbers stay numbers
+def _parse_bet(bet_type, val, amount):
+    if "-" in val:      # split, e.g. --bet split 17-20 5
+        val = tuple(int(v) for v in val.split("-"))
+    elif val.isdigit():
+        val = int(val)
+    return (bet_type, val), int(amount)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch Monte Carlo simulation of the roulette wheel.")
+    parser.add_argument("--spins", type=int, default=10_000_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--block", type=int, default=1_000_000, help="spins per block")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes, 0 for one per core")
+    parser.add_argument("--bet", nargs=3, action="append", metavar=("TYPE", "VALUE", "AMOUNT"),
+                        help="e.g. --bet color RED 10 --bet number 17 1 --bet split 17-20 5")
+    args = parser.parse_args(argv)
+
+    layout = dict(_parse_bet(*bet) for bet in args.bet or [("color", "RED", "1")])
+    try:
+        _check_layout(layout)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.workers == 1:
+        result = simulate(args.spins, layout, args.seed, args.block)
+    else:
+        result = run_parallel(args.spins, layout, args.seed, args.workers or os.cpu_count(), args.block)
+    print(f"Spins: {result.spins:,} in {result.seconds:.2f}s ({result.spins_per_sec:,.0f} spins/sec)")
+    print(f"Staked: {result.staked:,.0f}  Returned: {result.returned:,.0f}  House edge: {result.house_edge:.4%}")
+    print(f"Largest single-spin return: {result.max_return:,.0f}")
+    for bet_id, pnl in result.bet_pnl.items():
+        print(f"  P&L {bet_id}: {pnl:+,}")
+    print("Pocket frequencies:")
+    for n in range(37):
+        print(f"  {n:2d}: {result.pocket_counts[n] / result.spins:.5f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Pre-rendered wheel faces for the raster mode of WheelCanvas.
+The face (ring, sectors, labels, inner disc) is drawn once per rotation frame with Pillow,
+at a configurable angular resolution. Frames are kept in an LRU cache in memory and can
+also be stored on disk, keyed by radius, resolution and palette, so the next start loads
+them instead of drawing them again. Needs Pillow (pip install pillow), only for this mode.
+This module must not import tkinter; the canvas converts frames to PhotoImages itself.
+
+Example:
+    python Roulette_Sprites.py --radius 200 --resolution 3 --cache-dir ~/.cache/roulette
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+
+from Roulette_Rules import EUROPEAN_ORDER, SECTOR_ANGLE, DARK_GREEN, number_color
+
+TWO_PI = 2 * math.pi
+SPRITE_VERSION = 1      # Bump when the drawing changes so old disk caches are not reused
+
+# Colours of the vector renderer in WheelCanvas
+DEFAULT_PALETTE = {"background": DARK_GREEN, "ring": "#3C1912", "outline": "#111",
+                   "inner": "#222", "label": "white"}
+
+def _pillow():
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        raise ImportError("The raster wheel needs Pillow: pip install pillow")
+    return Image, ImageDraw, ImageFont
+
+def _font(size=16):
+    _, _, ImageFont = _pillow()
+    for name in ("DejaVuSans-Bold.ttf", "Arial Bold.ttf", "arialbd.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+# ------------------------------ Rendering ------------------------------
+
+def render_face(radius, wheel_angle, palette=DEFAULT_PALETTE, font=None):
+    """Wheel face at the given rotation as an RGB image the size of the wheel canvas,
+    with the same geometry as WheelCanvas' vector renderer (upright labels)."""
+    Image, ImageDraw, _ = _pillow()
+    size = 2 * (radius + 30)
+    image = Image.new("RGB", (size, size), palette["background"])
+    draw = ImageDraw.Draw(image)
+    cx = cy = size // 2
+    R = radius
+    draw.ellipse((cx-R-20, cy-R-20, cx+R+20, cy+R+20), fill=palette["ring"])
+
+    edges = [(cx + R * math.cos(i * SECTOR_ANGLE + wheel_angle), cy + R * math.sin(i * SECTOR_ANGLE + wheel_angle))
+             for i in range(len(EUROPEAN_ORDER) + 1)]
+    for idx, n in enumerate(EUROPEAN_ORDER):
+        draw.polygon([(cx, cy), edges[idx], edges[idx + 1]], fill=palette.get(n, number_color(n)),
+                     outline=palette["outline"])
+
+    font = font or _font()
+    r_text = R - 15
+    for idx, n in enumerate(EUROPEAN_ORDER):
+        a = (idx + 0.5) * SECTOR_ANGLE + wheel_angle
+        draw.text((cx + r_text * math.cos(a), cy + r_text * math.sin(a)), str(n),
+                  fill=palette["label"], font=font, anchor="mm")
+
+    draw.ellipse((cx-R+45, cy-R+45, cx+R-45, cy+R-45), fill=palette["inner"], outline=palette["outline"])
+    return image
+
+# ------------------------------ Frame Cache ------------------------------
+
+class SpriteCache:
+    """Rotation frames of one wheel face. frame(angle) returns the frame nearest to the angle.
+    By default every frame is kept in memory; with a smaller `max_frames` the least recently
+    used ones are dropped, which only pays off when the wheel stays in a few positions.
+    `convert` turns a rendered image into what is stored (a PhotoImage for the canvas)."""
+
+    def __init__(self, radius, resolution=3.0, palette=None, max_frames=None, cache_dir=None, convert=None):
+        self.radius = radius
+        self.size = 2 * (radius + 30)
+        self.count = max(1, round(360 / resolution))     # frames per turn
+        self.palette = dict(DEFAULT_PALETTE, **(palette or {}))
+        self.max_frames = max_frames if max_frames is not None else self.count
+        self.convert = convert or (lambda image: image)
+        self.cache_dir = None
+        if cache_dir:
+            self.cache_dir = os.path.join(os.path.expanduser(cache_dir), self.key())
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self._frames = OrderedDict()    # frame index -> converted frame
+        self._font = None
+        self.hits = self.renders = self.disk_loads = 0
+        self.render_seconds = 0.0
+
+    def key(self):
+        """Disk cache key: radius, frame count and a hash of the palette."""
+        palette = json.dumps(sorted((str(k), v) for k, v in self.palette.items()))
+        digest = hashlib.sha1(f"{SPRITE_VERSION}:{palette}".encode()).hexdigest()[:12]
+        return f"wheel_r{self.radius}_n{self.count}_{digest}"
+
+    def index(self, wheel_angle):
+        return round((wheel_angle % TWO_PI) / TWO_PI * self.count) % self.count
+
+    def angle(self, index):
+        return index * TWO_PI / self.count
+
+    def frame(self, wheel_angle):
+        i = self.index(wheel_angle)
+        frame = self._frames.get(i)
+        if frame is not None:
+            self.hits += 1
+            self._frames.move_to_end(i)
+            return frame
+        frame = self._frames[i] = self.convert(self._image(i))
+        if len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+        return frame
+
+    def _path(self, i):
+        return os.path.join(self.cache_dir, f"frame_{i:04d}.png")
+
+    def _image(self, i):
+        Image, _, _ = _pillow()
+        start = time.perf_counter()
+        if self.cache_dir and os.path.exists(self._path(i)):
+            with Image.open(self._path(i)) as stored:
+                image = stored.convert("RGB")
+            self.disk_loads += 1
+        else:
+            if self._font is None:
+                self._font = _font()
+            image = render_face(self.radius, self.angle(i), self.palette, self._font)
+            if self.cache_dir:
+                image.save(self._path(i))
+            self.renders += 1
+        self.render_seconds += time.perf_counter() - start
+        return image
+
+    def prerender(self):
+        """Make every frame available: draw missing ones into the disk cache (if any) and
+        fill the memory cache up to max_frames."""
+        for i in range(self.count):
+            if i < self.max_frames:
+                self.frame(self.angle(i))
+            elif self.cache_dir and not os.path.exists(self._path(i)):
+                self._image(i)
+
+    @property
+    def memory_bytes(self):
+        # Tk keeps photo images as 32-bit pixels
+        return len(self._frames) * self.size * self.size * 4
+
+    def stats(self):
+        return {"frames": self.count, "in_memory": len(self._frames), "memory_mb": self.memory_bytes / 2**20,
+                "hits": self.hits, "renders": self.renders, "disk_loads": self.disk_loads,
+                "render_ms_per_frame": 1000 * self.render_seconds / max(1, self.renders + self.disk_loads)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render the wheel frames of the raster mode.")
+    parser.add_argument("--radius", type=int, default=200)
+    parser.add_argument("--resolution", type=float, default=3.0, help="degrees between frames")
+    parser.add_argument("--frames", type=int, default=None, help="frames kept in memory (default: all)")
+    parser.add_argument("--cache-dir", default=None)
+    args = parser.parse_args(argv)
+
+    cache = SpriteCache(args.radius, args.resolution, max_frames=args.frames, cache_dir=args.cache_dir)
+    start = time.perf_counter()
+    cache.prerender()
+    stats = cache.stats()
+    print(f"{stats['frames']} frames of {cache.size}x{cache.size} in {time.perf_counter() - start:.2f}s "
+          f"({stats['renders']} drawn, {stats['disk_loads']} loaded, {stats['render_ms_per_frame']:.2f} ms each)")
+    print(f"{stats['in_memory']} frames in memory, about {stats['memory_mb']:.1f} MB as Tk photo images "
+          f"({cache.size * cache.size * 4 * stats['frames'] / 2**20:.1f} MB for all frames)")
+    if cache.cache_dir:
+        print(f"Disk cache: {cache.cache_dir}")
+
+if __name__ == "__main__":
+    main()
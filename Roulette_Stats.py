@@ -0,0 +1,133 @@
+"""Live statistics of winning numbers.
+Every counter is updated in constant time per spin, so the cost does not grow in a long
+session: all-time and rolling-window counts per number, colour and dozen, colour streaks,
+a ring buffer of the last `window` results and chi-square fairness scores. The chi-square
+statistic is kept through the running sum of squared counts, since
+sum((c - E)^2 / E) = sum(c^2) / E - n  with E = n / 37.
+This module must not import tkinter.
+
+Example:
+    python Roulette_Stats.py --spins 1000000 --window 500
+"""
+
+import argparse
+import random
+import time
+
+from Roulette_Rules import EUROPEAN_ORDER, RED_NUMBERS, BLACK_NUMBERS
+from Roulette_Engine import SpinEngine
+
+POCKETS = len(EUROPEAN_ORDER)
+CHI2_CRITICAL = 50.998      # 95th percentile of chi-square with 36 degrees of freedom
+
+def color_of(n):
+    return "RED" if n in RED_NUMBERS else "BLACK" if n in BLACK_NUMBERS else "GREEN"
+
+def dozen_of(n):
+    return 0 if n == 0 else (n - 1) // 12 + 1     # 0 for the zero pocket
+
+class _Counts:
+    # Counts per number, colour and dozen plus the sum of squared number counts
+    def __init__(self):
+        self.numbers = [0] * POCKETS
+        self.colors = {"RED": 0, "BLACK": 0, "GREEN": 0}
+        self.dozens = [0] * 4
+        self.total = 0
+        self.square_sum = 0
+
+    def change(self, n, delta):
+        c = self.numbers[n]
+        self.square_sum += 2 * c * delta + 1      # (c +- 1)^2 - c^2
+        self.numbers[n] = c + delta
+        self.colors[color_of(n)] += delta
+        self.dozens[dozen_of(n)] += delta
+        self.total += delta
+
+    def chi_square(self):
+        if not self.total:
+            return 0.0
+        expected = self.total / POCKETS
+        return self.square_sum / expected - self.total
+
+class LiveStats:
+    """Statistics fed with one winning number per spin. `window` is the size of the ring
+    buffer of recent results the rolling figures are computed over."""
+
+    def __init__(self, window=500):
+        self.window = window
+        self.recent = [None] * window   # ring buffer, slot spins % window holds the newest result
+        self.spins = 0
+        self.all_time = _Counts()
+        self.rolling = _Counts()
+        self.streak_color = None
+        self.streak = 0
+        self.longest = {"RED": 0, "BLACK": 0, "GREEN": 0}
+
+    def add(self, n):
+        """Record a result. Returns (slot, changed): the ring buffer slot that was written and
+        the numbers whose counts changed (the new one and the one that left the window)."""
+        slot = self.spins % self.window
+        evicted = self.recent[slot]
+        self.recent[slot] = n
+        self.spins += 1
+        self.all_time.change(n, 1)
+        self.rolling.change(n, 1)
+        changed = {n}
+        if evicted is not None:
+            self.rolling.change(evicted, -1)
+            changed.add(evicted)
+
+        color = color_of(n)
+        self.streak = self.streak + 1 if color == self.streak_color else 1
+        self.streak_color = color
+        self.longest[color] = max(self.longest[color], self.streak)
+        return slot, changed
+
+    # Results in the window, oldest first
+    def last(self, count=None):
+        n = min(self.spins, self.window)
+        count = n if count is None else min(count, n)
+        return [self.recent[(self.spins - count + k) % self.window] for k in range(count)]
+
+    def hot(self, k=5):
+        """The k numbers that came most often in the window (ties go to the lower number)."""
+        return sorted(range(POCKETS), key=lambda n: (-self.rolling.numbers[n], n))[:k]
+
+    def cold(self, k=5):
+        return sorted(range(POCKETS), key=lambda n: (self.rolling.numbers[n], n))[:k]
+
+    def _share(self, counts, key):
+        return counts[key] / self.rolling.total if self.rolling.total else 0.0
+
+    def color_frequency(self, color):
+        return self._share(self.rolling.colors, color)
+
+    def dozen_frequency(self, dozen):
+        return self._share(self.rolling.dozens, dozen)
+
+    def chi_square(self, rolling=True):
+        return (self.rolling if rolling else self.all_time).chi_square()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Feed simulated spins into the live statistics.")
+    parser.add_argument("--spins", type=int, default=1_000_000)
+    parser.add_argument("--window", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    engine = SpinEngine(random.Random(args.seed))
+    winners = [engine.spin().winner for _ in range(args.spins)]
+    stats = LiveStats(args.window)
+    start = time.perf_counter()
+    for n in winners:
+        stats.add(n)
+    seconds = time.perf_counter() - start
+    print(f"{args.spins:,} results in {seconds:.2f}s ({1e6 * seconds / args.spins:.2f} us per result)")
+    print(f"Hot {stats.hot()}, cold {stats.cold()}")
+    print("Dozens " + ", ".join(f"{d}: {stats.dozen_frequency(d):.1%}" for d in (1, 2, 3)))
+    print(f"Longest streaks {stats.longest}")
+    print(f"Chi-square last {args.window}: {stats.chi_square():.1f}, all time: {stats.chi_square(False):.1f} "
+          f"(95% critical value {CHI2_CRITICAL})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Betting strategies and a batch backtester.
+A strategy emits the same layout the table uses (bet_id -> amount) every round from the
+round history and the current balance. The backtester plays thousands of bankroll
+trajectories at once against the vectorized spin physics of Roulette_Simulation.
+
+Example:
+    python Roulette_Strategies.py --trajectories 10000 --rounds 1000 --seed 1
+"""
+
+import argparse
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from Roulette_Rules import PAYOUT_TABLE, compute_payout
+from Roulette_Simulation import draw_params_batch, settle_batch
+
+# ------------------------------ Strategies ------------------------------
+
+class RoundRecord(NamedTuple):
+    """One played round as seen by a strategy."""
+    winner: int
+    bets: dict      # bet_id -> amount that was placed
+    payout: int     # amount returned, stake included
+
+class Strategy:
+    """Base class for betting strategies.
+    next_bets() gets the list of RoundRecords played so far and the balance, and returns the
+    layout for the next round. Strategies that only ever stake one bet_id can also set
+    `vectorized = True` and implement next_stakes() so many trajectories are played at once."""
+
+    name = "strategy"
+    vectorized = False
+
+    def next_bets(self, history, balance):
+        raise NotImplementedError
+
+    # Stakes of all trajectories from their previous stake and whether it won (NumPy arrays)
+    def next_stakes(self, last_stake, last_won):
+        raise NotImplementedError
+
+class _SingleBetStrategy(Strategy):
+    # Shared scalar path for the progressions below: stake one bet_id, sized by next_stakes
+    vectorized = True
+
+    def __init__(self, bet_id=('color', 'RED'), unit=10):
+        self.bet_id = bet_id
+        self.unit = unit
+
+    def next_bets(self, history, balance):
+        if history:
+            last = history[-1]
+            last_stake = np.array([last.bets.get(self.bet_id, 0)])
+            stake = int(self.next_stakes(last_stake, np.array([last.payout > 0]))[0])
+        else:
+            stake = self.unit
+        stake = min(stake, balance)
+        return {self.bet_id: stake} if stake > 0 else {}
+
+class FlatBet(_SingleBetStrategy):
+    """Same stake every round."""
+    name = "flat"
+
+    def next_stakes(self, last_stake, last_won):
+        return np.full(len(last_stake), self.unit)
+
+class Martingale(_SingleBetStrategy):
+    """Double the stake after a loss, back to one unit after a win."""
+    name = "martingale"
+
+    def next_stakes(self, last_stake, last_won):
+        return np.where(last_won | (last_stake == 0), self.unit, 2 * last_stake)
+
+class DAlembert(_SingleBetStrategy):
+    """One unit more after a loss, one unit less after a win (never below one unit)."""
+    name = "dalembert"
+
+    def next_stakes(self, last_stake, last_won):
+        stake = np.where(last_won, last_stake - self.unit, last_stake + self.unit)
+        return np.maximum(stake, self.unit)
+
+STRATEGIES = {cls.name: cls for cls in (FlatBet, Martingale, DAlembert)}
+
+# ------------------------------ Backtesting ------------------------------
+
+class BacktestResult(NamedTuple):
+    strategy: str
+    final_balance: np.ndarray   # per trajectory
+    max_drawdown: np.ndarray    # largest drop from a previous peak, per trajectory
+    ruined: np.ndarray          # True when the balance could no longer cover a bet
+    rounds: int                 # rounds played over all trajectories
+    seconds: float
+
+    @property
+    def ruin_probability(self):
+        return float(self.ruined.mean())
+
+    @property
+    def rounds_per_sec(self):
+        return self.rounds / self.seconds if self.seconds else float("inf")
+
+    def percentiles(self, qs=(5, 25, 50, 75, 95)):
+        return dict(zip(qs, np.percentile(self.final_balance, qs).tolist()))
+
+def _spin_winners(n, rng):
+    return settle_batch(draw_params_batch(n, rng))[3]
+
+def _backtest_vectorized(strategy, trajectories, rounds, bankroll, rng):
+    returns = np.asarray(PAYOUT_TABLE[strategy.bet_id])
+    balance = np.full(trajectories, bankroll, dtype=np.int64)
+    peak = balance.copy()
+    drawdown = np.zeros(trajectories, dtype=np.int64)
+    stake = np.zeros(trajectories, dtype=np.int64)
+    won = np.zeros(trajectories, dtype=bool)
+    played = 0
+    for _ in range(rounds):
+        stake = np.minimum(strategy.next_stakes(stake, won), balance)
+        active = balance > 0
+        if not active.any():
+            break
+        stake = np.where(active, stake, 0)
+        multiplier = returns[_spin_winners(trajectories, rng)]
+        won = multiplier > 0
+        # Rounded down like compute_payout
+        balance += np.floor(stake * multiplier).astype(np.int64) - stake
+        np.maximum(peak, balance, out=peak)
+        np.maximum(drawdown, peak - balance, out=drawdown)
+        played += int(active.sum())
+    return balance, drawdown, balance <= 0, played
+
+def _backtest_scalar(strategy, trajectories, rounds, bankroll, rng):
+    balance = np.full(trajectories, bankroll, dtype=np.int64)
+    drawdown = np.zeros(trajectories, dtype=np.int64)
+    ruined = np.zeros(trajectories, dtype=bool)
+    played = 0
+    for t in range(trajectories):
+        # One trajectory at a time, the spins are still drawn in one batch
+        history = []
+        money = peak = bankroll
+        for winner in _spin_winners(rounds, rng).tolist():
+            bets = strategy.next_bets(history, money)
+            total = sum(bets.values())
+            if total == 0 or total > money:
+                ruined[t] = True
+                break
+            payout = compute_payout(bets, winner)
+            money += payout - total
+            history.append(RoundRecord(winner, bets, payout))
+            peak = max(peak, money)
+            drawdown[t] = max(drawdown[t], peak - money)
+            played += 1
+        balance[t] = money
+    return balance, drawdown, ruined | (balance <= 0), played
+
+def backtest(strategy, trajectories=10_000, rounds=1_000, bankroll=2000, seed=None):
+    """Play `trajectories` independent bankrolls for up to `rounds` rounds each.
+    Vectorized strategies are played all trajectories at once, others one at a time."""
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    run = _backtest_vectorized if strategy.vectorized else _backtest_scalar
+    balance, drawdown, ruined, played = run(strategy, trajectories, rounds, bankroll, rng)
+    return BacktestResult(strategy.name, balance, drawdown, ruined, played, time.perf_counter() - start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest betting strategies against the wheel.")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), action="append")
+    parser.add_argument("--trajectories", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=1_000)
+    parser.add_argument("--bankroll", type=int, default=2000)
+    parser.add_argument("--unit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    for name in args.strategy or sorted(STRATEGIES):
+        result = backtest(STRATEGIES[name](unit=args.unit), args.trajectories, args.rounds,
+                          args.bankroll, args.seed)
+        pct = result.percentiles()
+        print(f"{name}: {result.rounds:,} rounds in {result.seconds:.2f}s ({result.rounds_per_sec:,.0f} rounds/sec)")
+        print(f"  ruin probability {result.ruin_probability:.4f}, "
+              f"mean max drawdown {result.max_drawdown.mean():,.1f}")
+        print("  final balance " + ", ".join(f"p{q}={v:,.0f}" for q, v in pct.items()))
+
+if __name__ == "__main__":
+    main()
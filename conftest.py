@@ -0,0 +1,5 @@
+# The modules live at the top level of the repository; put it on sys.path for the tests
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,97 @@
+"""The closed-form SpinEngine against the frame-by-frame loop of the original spin_wheel, and the
+wall-clock SpinClock that drives the animation."""
+
+import math
+import random
+
+import pytest
+
+from Roulette_Engine import SpinClock, SpinEngine, resolve_winner, moving_steps, stop_step
+
+TWO_PI = 2 * math.pi
+
+# The original animation: decelerate both velocities towards 0, advance the angles by
+# velocity * 0.03, stop when both speeds are below 0.01
+def step_loop(params, wheel_angle=0.0, ball_angle=0.0):
+    wheel_vel, ball_vel = params.wheel_vel, params.ball_vel
+    steps = 0
+    while True:
+        wheel_vel = max(0, wheel_vel - params.wheel_decel)
+        ball_vel = min(0, ball_vel + params.ball_decel)
+        wheel_angle = (wheel_angle + wheel_vel * 0.03) % TWO_PI
+        ball_angle = (ball_angle + ball_vel * 0.03) % TWO_PI
+        steps += 1
+        if abs(wheel_vel) < 0.01 and abs(ball_vel) < 0.01:
+            return wheel_angle, ball_angle, steps
+
+def angle_gap(a, b):
+    d = abs(a - b) % TWO_PI
+    return min(d, TWO_PI - d)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_settle_matches_step_loop(seed):
+    engine = SpinEngine(random.Random(seed))
+    rng = random.Random(100 + seed)
+    for _ in range(200):
+        params = engine.draw_params()
+        start_wheel, start_ball = rng.random() * TWO_PI, rng.random() * TWO_PI
+        wheel_angle, ball_angle, steps = step_loop(params, start_wheel, start_ball)
+        result = engine.settle(params, start_wheel, start_ball)
+        assert result.steps == steps
+        assert angle_gap(result.wheel_angle, wheel_angle) < 1e-9
+        assert angle_gap(result.ball_angle, ball_angle) < 1e-9
+        assert result.winner == resolve_winner(wheel_angle, ball_angle)
+
+def test_state_at_matches_every_frame():
+    engine = SpinEngine(random.Random(7))
+    params = engine.draw_params()
+    wheel_vel, ball_vel = params.wheel_vel, params.ball_vel
+    wheel_angle = ball_angle = 0.0
+    for step in range(1, engine.settle(params).steps + 1):
+        wheel_vel = max(0, wheel_vel - params.wheel_decel)
+        ball_vel = min(0, ball_vel + params.ball_decel)
+        wheel_angle = (wheel_angle + wheel_vel * 0.03) % TWO_PI
+        ball_angle = (ball_angle + ball_vel * 0.03) % TWO_PI
+        state = engine.state_at(params, step)
+        assert angle_gap(state[0], wheel_angle) < 1e-9
+        assert angle_gap(state[1], ball_angle) < 1e-9
+
+@pytest.mark.parametrize("speed, decel", [(5.0, 0.05), (7.0, 0.04), (0.05, 0.01), (0.009, 0.04), (10.0, 0.1)])
+def test_step_counts_match_their_definitions(speed, decel):
+    moving = moving_steps(speed, decel)
+    assert speed - moving * decel > 0 or moving == 0
+    assert speed - (moving + 1) * decel <= 0
+    stop = stop_step(speed, decel)
+    assert speed - stop * decel < 0.01
+    assert stop == 1 or speed - (stop - 1) * decel >= 0.01
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+def test_spin_clock_skips_late_steps():
+    clock = FakeClock()
+    spin = SpinClock(20, step_seconds=0.25, clock=clock)
+    assert spin.advance() is None           # no time has passed
+    clock.now += 0.25
+    assert spin.advance() == 1
+    assert spin.advance() is None           # same frame time, nothing new to show
+    clock.now += 1.0                        # a late frame: steps 2, 3 and 4 are skipped
+    assert spin.advance() == 5
+    assert (spin.frames, spin.skipped, spin.done) == (2, 3, False)
+    clock.now += 100.0                      # never past the last step
+    assert spin.advance() == 20
+    assert (spin.frames, spin.skipped, spin.done) == (3, 17, True)
+    assert spin.advance() is None
+
+def test_spin_clock_finish_jumps_to_the_last_step():
+    clock = FakeClock()
+    spin = SpinClock(50, step_seconds=0.25, clock=clock)
+    clock.now += 0.5
+    assert spin.advance() == 2              # step 1 skipped
+    spin.finish()
+    assert spin.advance() == 50             # steps 3 to 49 skipped
+    assert spin.done and spin.skipped == 1 + 47
@@ -0,0 +1,78 @@
+"""Round trip of the binary journal, including a file torn by a crash."""
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from Roulette_Engine import RouletteTable, SpinEngine
+from Roulette_Journal import Journal, JournalWriter, bets_path
+from Roulette_Rules import BET_IDS, BET_UNITS
+
+def play(table, rounds, layouts):
+    played = []
+    for _ in range(rounds):
+        bets = layouts.choice([{("color", "RED"): 10},
+                               {bet_id: BET_UNITS[bet_id] for bet_id in layouts.sample(BET_IDS, 40)}])
+        for bet_id, amount in bets.items():
+            table.place_bet(bet_id, amount)
+        result, payout = table.play()
+        played.append((result, dict(bets), payout))
+        table.clear_bets()
+    return played
+
+def check(journal, played):
+    assert len(journal) == len(played)
+    for i, (result, bets, payout) in enumerate(played):
+        record = journal.records[i]
+        assert record["round"] == i
+        assert record["winner"] == result.winner
+        assert tuple(float(record[f]) for f in ("wheel_vel", "ball_vel", "wheel_decel", "ball_decel")) == result.params
+        assert record["wheel_angle"] == result.wheel_angle
+        assert record["payout"] == payout
+        assert journal.bets(i) == bets
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "rounds.rlj"
+    table = RouletteTable(10**9, SpinEngine(random.Random(1)), JournalWriter(path, fsync_every=7))
+    played = play(table, 30, random.Random(2))
+    table.journal.close()
+    check(Journal(path), played)
+
+def test_append_after_torn_record(tmp_path):
+    path = tmp_path / "rounds.rlj"
+    layouts = random.Random(3)
+    table = RouletteTable(10**9, SpinEngine(random.Random(4)), JournalWriter(path))
+    played = play(table, 5, layouts)
+    table.journal.close()
+    with open(path, "ab") as f:
+        f.write(b"\xff" * 37)      # a record cut short by a crash
+    with open(bets_path(path), "ab") as f:
+        f.write(b"\xff" * 100)     # and bet rows written before it
+
+    assert len(Journal(path)) == 5  # the reader ignores the torn record
+    table.journal = JournalWriter(path)
+    played += play(table, 4, layouts)
+    table.journal.close()
+    check(Journal(path), played)
+
+def test_records_locate_philox_spins(tmp_path):
+    from Roulette_RNG import PhiloxSource
+    path = tmp_path / "rounds.rlj"
+    table = RouletteTable(10**9, SpinEngine(PhiloxSource(42)), JournalWriter(path))
+    played = play(table, 6, random.Random(5))
+    table.journal.close()
+    record = Journal(path).records[4]
+    source = PhiloxSource(int(record["seed"]))
+    source.seek(int(record["spin"]))
+    assert SpinEngine(source).draw_params() == played[4][0].params
+
+def test_append_after_close_raises(tmp_path):
+    path = tmp_path / "rounds.rlj"
+    table = RouletteTable(10**9, SpinEngine(random.Random(6)), JournalWriter(path))
+    play(table, 2, random.Random(7))
+    table.journal.close()
+    with pytest.raises(ValueError):
+        play(table, 1, random.Random(8))
+    assert len(Journal(path)) == 2
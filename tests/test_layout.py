@@ -0,0 +1,34 @@
+"""The grid hit index against a scan of every cell and zone."""
+
+import random
+
+import pytest
+
+from Roulette_Layout import TableLayout
+
+# The smallest area containing the point wins, ties go to the one added first
+def brute_force(layout, x, y):
+    hits = [((a.x1 - a.x0) * (a.y1 - a.y0), order, a.bet_id)
+            for order, a in enumerate(layout.cells + layout.zones)
+            if a.x0 <= x <= a.x1 and a.y0 <= y <= a.y1]
+    return min(hits)[2] if hits else None
+
+@pytest.mark.parametrize("height", [600, 1000])
+def test_grid_points(height):
+    layout = TableLayout(height)
+    for x in range(0, 260, 2):
+        for y in range(0, height, 2):
+            assert layout.bet_at(x, y) == brute_force(layout, x, y), (x, y)
+
+@pytest.mark.parametrize("bucket", [7, 10, 33])
+def test_random_points(bucket):
+    layout = TableLayout(1000, bucket)
+    rng = random.Random(bucket)
+    for _ in range(20_000):
+        x, y = rng.uniform(-5, 260), rng.uniform(-5, 1000)
+        assert layout.bet_at(x, y) == brute_force(layout, x, y), (x, y)
+
+def test_every_inside_bet_is_reachable():
+    layout = TableLayout(1000)
+    for zone in layout.zones:
+        assert layout.bet_at((zone.x0 + zone.x1) / 2, (zone.y0 + zone.y1) / 2) == zone.bet_id
@@ -0,0 +1,50 @@
+"""SharedTable betting is all-or-nothing and its settlement matches compute_payout per player."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Roulette_Engine import SpinEngine
+from Roulette_Multiplayer import SharedTable, random_layouts
+from Roulette_Rules import BET_IDS, BET_INDEX, compute_payout
+
+def layouts_of(players, bets, amounts, count):
+    layouts = [{} for _ in range(count)]
+    for player, bet, amount in zip(players, bets, amounts):
+        bet_id = BET_IDS[bet]
+        layouts[player][bet_id] = layouts[player].get(bet_id, 0) + int(amount)
+    return layouts
+
+@pytest.mark.parametrize("players, bets, amounts", [
+    ([0, 1, 2], [0, 1, 7], [10, 10, -10]),                                  # negative amount
+    ([0, 1, 2], [0, 1, len(BET_IDS)], [10, 10, 10]),                        # unknown bet
+    ([0, 1, 5], [0, 1, 2], [10, 10, 10]),                                   # unknown player
+    ([0, 1, 2], [0, BET_INDEX[("neighbours", 17)], 2], [10, 1, 10]),       # not a unit multiple
+    ([0, 1, 1], [0, 1, 2], [10, 1500, 600]),                                # over the balance
+])
+def test_place_bets_is_all_or_nothing(players, bets, amounts):
+    table = SharedTable(3, balance=2000)
+    table.place_bet(1, ("color", "RED"), 100)
+    stakes, staked = table.stakes.copy(), table.staked.copy()
+    with pytest.raises(ValueError):
+        table.place_bets(players, bets, amounts)
+    assert (table.stakes == stakes).all()
+    assert (table.staked == staked).all()
+
+def test_settle_matches_compute_payout():
+    rng = np.random.default_rng(3)
+    table = SharedTable(200, balance=10**6, engine=SpinEngine(random.Random(3)))
+    for _ in range(5):
+        players, bets, amounts = random_layouts(200, 30, rng)
+        table.place_bets(players, bets, amounts)
+        layouts = layouts_of(players, bets, amounts, 200)
+        before = table.balance.copy()
+        result, round_result = table.play()
+        for i, layout in enumerate(layouts):
+            payout = compute_payout(layout, result.winner)
+            assert round_result.payout[i] == payout
+            assert round_result.staked[i] == sum(layout.values())
+            assert table.balance[i] == before[i] - sum(layout.values()) + payout
+        assert not table.staked.any() and not table.stakes.any()
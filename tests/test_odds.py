@@ -0,0 +1,66 @@
+"""Incremental LayoutOdds against a fresh computation of the same layout, and its stats cache."""
+
+import random
+
+import pytest
+
+from Roulette_Odds import LayoutOdds
+from Roulette_Rules import BET_IDS, BET_UNITS, compute_payout
+
+def fresh(bets, probabilities=None):
+    odds = LayoutOdds(probabilities)
+    for bet_id, amount in bets.items():
+        odds.set_amount(bet_id, amount)
+    return odds
+
+def check(odds, probabilities=None):
+    assert odds.returns == [compute_payout(odds.bets, n) for n in range(37)]
+    assert odds.staked == sum(odds.bets.values())
+    assert odds.stats() == fresh(odds.bets, probabilities)._compute()
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_matches_fresh(seed):
+    rng = random.Random(seed)
+    probabilities = [rng.random() for _ in range(37)]
+    probabilities = [p / sum(probabilities) for p in probabilities] if seed else None
+    odds = LayoutOdds(probabilities)
+    for _ in range(400):
+        op = rng.random()
+        if op < 0.6:
+            bet_id = rng.choice(BET_IDS)
+            odds.add(bet_id, BET_UNITS[bet_id] * rng.randint(1, 20))
+        elif op < 0.85 and odds.bets:
+            odds.remove(rng.choice(list(odds.bets)))
+        elif op < 0.97:
+            odds.set_layout({bet_id: BET_UNITS[bet_id] for bet_id in rng.sample(BET_IDS, rng.randint(0, 30))})
+        else:
+            odds.clear()
+        check(odds, probabilities)
+
+def test_same_layout_in_another_order_hits_the_cache():
+    bets = {("color", "RED"): 10, ("number", 17): 5, ("neighbours", 0): 15, ("split", (17, 20)): 2}
+    odds = LayoutOdds()
+    for bet_id, amount in bets.items():
+        odds.add(bet_id, amount)
+    first = odds.stats()
+    assert (odds.hits, odds.misses) == (0, 1)
+
+    odds.clear()
+    for bet_id in reversed(list(bets)):
+        odds.add(bet_id, bets[bet_id])
+    assert odds.stats() == first
+    assert (odds.hits, odds.misses) == (1, 1)
+
+    odds.add(("number", 17), 1)
+    assert odds.stats() != first
+    odds.set_amount(("number", 17), 5)
+    assert odds.stats() == first
+    assert (odds.hits, odds.misses) == (2, 2)
+
+def test_invalid_amount_leaves_the_layout_unchanged():
+    odds = fresh({("color", "RED"): 10})
+    before = (dict(odds.bets), list(odds.returns), odds.staked, odds.key)
+    for bet_id, amount in ((("neighbours", 5), 1), (("number", 1), -5), (("number", 37), 1)):
+        with pytest.raises(ValueError):
+            odds.add(bet_id, amount)
+    assert (odds.bets, odds.returns, odds.staked, odds.key) == before
@@ -0,0 +1,83 @@
+"""Bet masks and compute_payout against a bet-by-bet sum over the masks, bet units and check_bet."""
+
+import random
+
+import pytest
+
+from Roulette_Rules import (BET_IDS, BET_MASKS, BET_UNITS, BLACK_NUMBERS, EUROPEAN_ORDER, POCKET_BETS,
+                            RED_NUMBERS, bet_pockets, bet_return, check_bet, compute_payout)
+
+COVERAGE = {'number': 1, 'split': 2, 'street': 3, 'trio': 3, 'corner': 4, 'neighbours': 5, 'line': 6,
+            'dozen': 12, 'column': 12, 'color': 18, 'parity': 18, 'range': 18}
+
+# Every bet pays amount * 36 / covered numbers when the winner is in its mask
+def brute_force(bets, winner):
+    total = 0
+    for bet_id, amount in bets.items():
+        mask = BET_MASKS[bet_id]
+        if mask >> winner & 1:
+            total += amount * 36 // bin(mask).count("1")
+    return total
+
+def test_mask_sizes():
+    for bet_id in BET_IDS:
+        assert len(bet_pockets(bet_id)) == COVERAGE[bet_id[0]], bet_id
+
+def test_inside_bets_touch_on_the_grid():
+    for bet_type, val in BET_IDS:
+        if bet_type == 'split':
+            a, b = val
+            assert b - a == 3 or (b - a == 1 and a % 3 != 0) or (a == 0 and b <= 3), val
+        elif bet_type == 'corner' and val:
+            assert val % 3 != 0 and bet_pockets((bet_type, val)) == {val, val+1, val+3, val+4}
+
+def test_outside_bets():
+    assert bet_pockets(('color', 'RED')) == RED_NUMBERS
+    assert bet_pockets(('color', 'BLACK')) == BLACK_NUMBERS
+    assert bet_pockets(('parity', 'EVEN')) | bet_pockets(('parity', 'ODD')) == set(range(1, 37))
+    assert set().union(*(bet_pockets(('dozen', d)) for d in (1, 2, 3))) == set(range(1, 37))
+    assert set().union(*(bet_pockets(('column', c)) for c in (1, 2, 3))) == set(range(1, 37))
+
+def test_neighbours_are_consecutive_on_the_wheel():
+    for i, n in enumerate(EUROPEAN_ORDER):
+        expected = {EUROPEAN_ORDER[(i + k) % 37] for k in range(-2, 3)}
+        assert bet_pockets(('neighbours', n)) == expected
+
+def test_pocket_bets_match_masks():
+    for n in range(37):
+        assert set(POCKET_BETS[n]) == {bet_id for bet_id in BET_IDS if n in bet_pockets(bet_id)}
+
+@pytest.mark.parametrize("size", [1, 2, 5, 20, 60, len(BET_IDS)])
+def test_compute_payout_matches_brute_force(size):
+    rng = random.Random(size)
+    for _ in range(20):
+        bets = {bet_id: BET_UNITS[bet_id] * rng.randint(1, 50) for bet_id in rng.sample(BET_IDS, size)}
+        for winner in range(37):
+            assert compute_payout(bets, winner) == brute_force(bets, winner)
+
+@pytest.mark.parametrize("size", [0, len(BET_IDS)])
+def test_compute_payout_rejects_unknown_bets(size):
+    bets = {bet_id: BET_UNITS[bet_id] for bet_id in BET_IDS[:size]}
+    bets[('number', 37)] = 1
+    with pytest.raises(ValueError):
+        compute_payout(bets, 17)
+
+def test_units_make_every_return_whole():
+    for bet_id in BET_IDS:
+        unit = BET_UNITS[bet_id]
+        coverage = len(bet_pockets(bet_id))
+        assert unit == (5 if bet_id[0] == 'neighbours' else 1)
+        for units in range(1, 12):
+            assert unit * units * 36 % coverage == 0
+            assert bet_return(bet_id, unit * units) == unit * units * 36 / coverage
+
+@pytest.mark.parametrize("bet_id, amount", [(('neighbours', 17), 1), (('neighbours', 0), 7), (('number', 5), 0),
+                                            (('color', 'RED'), -10), (('number', 37), 1), (('split', (1, 5)), 2)])
+def test_check_bet_rejects(bet_id, amount):
+    with pytest.raises(ValueError):
+        check_bet(bet_id, amount)
+
+def test_check_bet_accepts_unit_multiples():
+    for bet_id in BET_IDS:
+        check_bet(bet_id, BET_UNITS[bet_id])
+        check_bet(bet_id, 3 * BET_UNITS[bet_id])
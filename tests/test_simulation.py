@@ -0,0 +1,43 @@
+"""The NumPy batch physics against the scalar engine, and worker-count invariance."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Roulette_Engine import SpinEngine, moving_steps, stop_step
+from Roulette_Simulation import (SpinBatch, moving_steps_batch, run_parallel, settle_batch, simulate,
+                                 stop_step_batch)
+
+def test_settle_batch_matches_engine():
+    engine = SpinEngine(random.Random(3))
+    params = [engine.draw_params() for _ in range(2000)]
+    batch = SpinBatch(*(np.array(column) for column in zip(*params)))
+    wheel, ball, steps, winners = settle_batch(batch, 1.0, 2.0)
+    for i, p in enumerate(params):
+        result = engine.settle(p, 1.0, 2.0)
+        assert steps[i] == result.steps
+        assert winners[i] == result.winner
+        assert wheel[i] == pytest.approx(result.wheel_angle, abs=1e-9)
+        assert ball[i] == pytest.approx(result.ball_angle, abs=1e-9)
+
+def test_step_counts_match_scalar():
+    rng = np.random.default_rng(0)
+    speed = np.concatenate([rng.uniform(0, 15, 5000), [0.01, 0.05, 1.0, 5.0]])
+    decel = np.concatenate([rng.uniform(0.005, 0.2, 5000), [0.01, 0.01, 0.1, 0.05]])
+    assert list(moving_steps_batch(speed, decel)) == [moving_steps(s, d) for s, d in zip(speed, decel)]
+    assert list(stop_step_batch(speed, decel)) == [stop_step(s, d) for s, d in zip(speed, decel)]
+
+def test_simulate_is_independent_of_worker_count():
+    layout = {("color", "RED"): 10, ("number", 17): 1, ("neighbours", 0): 5}
+    serial = simulate(50_000, layout, seed=11, block_spins=7_000)
+    for workers in (1, 2, 3):
+        parallel = run_parallel(50_000, layout, seed=11, workers=workers, block_spins=7_000)
+        assert (parallel.pocket_counts == serial.pocket_counts).all()
+        assert parallel.bet_pnl == serial.bet_pnl
+        assert parallel.returned == serial.returned
+
+def test_simulate_rejects_invalid_amounts():
+    with pytest.raises(ValueError):
+        simulate(10, {("neighbours", 17): 1}, seed=1)